@@ -0,0 +1,58 @@
+"""Measures the throughput of update() on a tracker with autosave enabled.
+
+Run from the repository root:
+    python benchmarks/bench_autosave.py
+
+Autosaved rows are written through a buffer, so autosave should cost little more
+than formatting each row. With a writer thread, the formatting moves off the
+updating thread, which then only queues the rows (the time includes waiting
+for the thread to write them all). The script exits with a non-zero status if the
+throughput with the default flush policy is below AUTOSAVE_TARGET_ROWS_PER_S.
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'simmon'))
+
+from simmon import Monitor  # noqa: E402
+
+N_CALLS = 200_000
+AUTOSAVE_TARGET_ROWS_PER_S = 200_000  # update() throughput with autosave and the default flush policy
+
+
+def _rows_per_second(super_directory, monitor_options=None, **options):
+    mon = Monitor('bench', super_directory=super_directory, enable_toggles=False, headless=True,
+                  **(monitor_options or {}))
+    tracker = mon.tracker('x', 'y', autosave=True, **options)
+
+    t0 = time.perf_counter()
+    for i in range(N_CALLS):
+        tracker.update(i, 0.5)
+    tracker.flush()
+    elapsed = time.perf_counter() - t0
+
+    mon.finalize()
+    return N_CALLS / elapsed
+
+
+def main():
+    with tempfile.TemporaryDirectory() as super_directory:
+        results = {
+            'default flush policy': _rows_per_second(super_directory),
+            'flush_every=1': _rows_per_second(super_directory, flush_every=1),
+            'autosave_thread=True': _rows_per_second(super_directory, {'autosave_thread': True}),
+            "autosave_format='binary'": _rows_per_second(super_directory, autosave_format='binary'),
+        }
+
+    for name, rate in results.items():
+        print(f'{name:<26}{rate:>12,.0f} rows/s')
+
+    rate = results['default flush policy']
+    print(f'\nAutosave throughput: {rate:,.0f} rows/s (target: {AUTOSAVE_TARGET_ROWS_PER_S:,} rows/s)')
+    return 0 if rate >= AUTOSAVE_TARGET_ROWS_PER_S else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
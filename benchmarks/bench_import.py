@@ -0,0 +1,58 @@
+"""Measures how long `import simmon` takes in a fresh interpreter.
+
+Run from the repository root:
+    python benchmarks/bench_import.py
+
+Plotting, the GUI and asyncio are imported lazily, so importing simmon should
+cost little more than importing numpy. The script exits with a non-zero status
+if the median import time exceeds IMPORT_TARGET_MS, or if any of the lazily
+imported modules is imported by `import simmon`.
+"""
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SIMMON_DIR = str(Path(__file__).resolve().parent.parent / 'simmon')
+
+N_RUNS = 10
+IMPORT_TARGET_MS = 150  # median time of `import simmon`, including numpy
+LAZY_MODULES = ['matplotlib', 'tkinter', 'asyncio', 'multiprocessing', 'concurrent.futures', 'urllib.request',
+                'pyautogui']
+
+# runs in a fresh interpreter, and prints the import time and the lazy modules that got imported
+_MEASURE = f"""
+import json, sys, time
+sys.path.insert(0, {SIMMON_DIR!r})
+t0 = time.perf_counter()
+import simmon
+elapsed = time.perf_counter() - t0
+print(json.dumps([elapsed, [name for name in {LAZY_MODULES!r} if name in sys.modules]]))
+"""
+
+
+def _measure():
+    output = subprocess.run([sys.executable, '-c', _MEASURE], check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def main():
+    durations = []
+    imported = set()
+    for _ in range(N_RUNS):
+        elapsed, modules = _measure()
+        durations.append(elapsed)
+        imported.update(modules)
+
+    median = statistics.median(durations) * 1e3
+    print(f'import simmon: median {median:.1f} ms, max {max(durations) * 1e3:.1f} ms '
+          f'(target: {IMPORT_TARGET_MS} ms)')
+    if imported:
+        print(f'Imported eagerly: {", ".join(sorted(imported))}')
+
+    return 0 if median <= IMPORT_TARGET_MS and not imported else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
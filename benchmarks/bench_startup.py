@@ -0,0 +1,38 @@
+"""Measures how long it takes to create a Monitor with its toggles window.
+
+Run from the repository root:
+    python benchmarks/bench_startup.py
+
+The window process is started without waiting for it to be ready, so creating a Monitor should
+only take a few milliseconds. The script exits with a non-zero status if the
+median startup time exceeds STARTUP_TARGET_MS.
+"""
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'simmon'))
+
+from simmon import QuietMonitor  # noqa: E402
+
+N_RUNS = 10
+STARTUP_TARGET_MS = 50  # median time of QuietMonitor() with toggles enabled
+
+
+def main():
+    durations = []
+    for _ in range(N_RUNS):
+        t0 = time.perf_counter()
+        mon = QuietMonitor(headless=False)  # start the window process even if there is no display
+        durations.append(time.perf_counter() - t0)
+        mon.finalize()
+
+    median = statistics.median(durations) * 1e3
+    print(f'Monitor startup: median {median:.1f} ms, max {max(durations) * 1e3:.1f} ms '
+          f'(target: {STARTUP_TARGET_MS} ms)')
+    return 0 if median <= STARTUP_TARGET_MS else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
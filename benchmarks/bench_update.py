@@ -0,0 +1,70 @@
+"""Measures the per-call overhead of recording data with a Tracker.
+
+Run from the repository root:
+    python benchmarks/bench_update.py
+
+The script exits with a non-zero status if the overhead of a recorder call
+of a preallocated columnar tracker exceeds RECORDER_TARGET_NS. List-based
+trackers are measured for reference: their cost includes creating a tuple per row.
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'simmon'))
+
+from simmon import QuietMonitor  # noqa: E402
+
+N_CALLS = 1_000_000
+RECORDER_TARGET_NS = 250  # per-call overhead target of Tracker.recorder() (preallocated columnar tracker)
+
+
+def _empty_loop(n):
+    """Time a loop that does nothing but pass two values to a function."""
+    def call(*values):
+        pass
+
+    t0 = time.perf_counter()
+    for i in range(n):
+        call(i, 0.5)
+    return time.perf_counter() - t0
+
+
+def _time_calls(record, n):
+    t0 = time.perf_counter()
+    for i in range(n):
+        record(i, 0.5)
+    return time.perf_counter() - t0
+
+
+def main():
+    baseline = _empty_loop(N_CALLS)
+
+    results = {}
+    for kind, options in (('list', {}), ('columnar', {'expected_rows': N_CALLS})):
+        # use a new Monitor for each measurement, so that data from
+        # previous measurements doesn't slow down garbage collection
+        mon = QuietMonitor(enable_toggles=False)
+        tracker = mon.tracker('x', 'y', **options)
+        results[f'update() [{kind}]'] = _time_calls(tracker.update, N_CALLS)
+
+        mon = QuietMonitor(enable_toggles=False)
+        tracker = mon.tracker('x', 'y', **options)
+        record = tracker.recorder()
+        elapsed = _time_calls(record, N_CALLS)
+        record.flush()
+        results[f'recorder() [{kind}]'] = elapsed
+
+    print(f'{"":<24}{"ns/call":>10}{"overhead ns/call":>20}')
+    for name, elapsed in results.items():
+        per_call = elapsed / N_CALLS * 1e9
+        overhead = (elapsed - baseline) / N_CALLS * 1e9
+        print(f'{name:<24}{per_call:>10.0f}{overhead:>20.0f}')
+
+    overhead = (results['recorder() [columnar]'] - baseline) / N_CALLS * 1e9
+    print(f'\nRecorder overhead: {overhead:.0f} ns/call (target: {RECORDER_TARGET_NS} ns/call)')
+    return 0 if overhead <= RECORDER_TARGET_NS else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,25 +1,108 @@
-import urllib.error
 import warnings
 from datetime import date, datetime
-from os import walk, remove, path
+from os import walk, remove, path, urandom, getpid, environ, replace, fsync
 from pathlib import Path
 import time
-import matplotlib
-import matplotlib.pyplot as plt
-from multiprocessing import Process, Queue, Manager
-from tkinter import Tk, Label, PhotoImage, Button, Frame
-from urllib.request import urlopen
 import numpy as np
-import socket
-
-# this next section imports pyautogui module only if it exists
-# in which case preventing-computer-sleep-mode is enabled.
+import shutil
+import tempfile
+import weakref
+from collections import OrderedDict
+import struct
+import pickle
+import json
+import sys
+import threading
+from collections import deque
+import itertools
+from contextlib import nullcontext, contextmanager
+import importlib
 import importlib.util
 
+
+class _LazyModule:
+    """A module that's imported the first time one of its attributes is used.
+    Plotting, the GUI and asyncio are only needed by some programs, and importing them
+    takes much longer than importing everything else, so they're imported lazily.
+    Other modules that are only needed in a single place (multiprocessing, tkinter,
+    pyautogui, concurrent.futures) are imported where they're used.
+
+    :param name: The full name of the module.
+    :type name: str
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+matplotlib = _LazyModule('matplotlib')
+plt = _LazyModule('matplotlib.pyplot')
+asyncio = _LazyModule('asyncio')
+
+# pyautogui is only imported by the toggles window process, and only if it exists,
+# in which case preventing-computer-sleep-mode is enabled.
 spam_spec = importlib.util.find_spec("pyautogui")  # if pyautogui module exists, enable keep awake functionality
 keep_awake = spam_spec is not None
-if keep_awake:
-    import pyautogui
+
+MAX_TOGGLES = 64  # the number of toggles a single toggles window can hold
+THREAD_BUFFER_SIZE = 10000  # the number of rows a thread buffers before merging them into a thread-safe tracker
+SPOOL_RETRY_INTERVAL = 1.0  # the time in seconds between attempts to merge a spool file into its output file
+
+# the icon of the toggles window (assets/simmon_logo.png, base64-encoded),
+# bundled here so that opening the window never waits for the network
+_ICON_PNG = (
+    'iVBORw0KGgoAAAANSUhEUgAAAnUAAAIUBAMAAACOcceYAAAACXBIWXMAABcRAAAXEQHKJvM/AAAAElBMVEVKhSINDQ0rShZ+fn5+'
+    'fn5HcEwJ9EIHAAAABnRSTlP////+igDgNUM7AAAMsElEQVR42u3dWXKrOBSAYcwKjO4GQNlAd+y8d5Xt91sVe/9baeMRbAYdISwh'
+    '/Xq7Uzr5+kwIkLOT2Tru99tNAmu73e8NSf5mRnC7TVprf3Bkt6+/2rfWqkhgKaX1Jf4ODuxque+qSGvpLwO9MbvjWU4XCS5V602y'
+    '2ycqd9MbDr1Bu3OL+C4SXurcNCztzvmaNN019KzsznRVkfoawuu3g+6y/vTj9dqd6YAbxuuzg67RMbYyO+iakfcjsdtR61p4B3M7'
+    '6F677cHU7rj5F6/W6ix5XXbH1Ediw37RZbejT3TgHUzsjhS7zpJnYkexMyx573ZkrGnWvtmRsb1Zux2z29Fje7P2MGz3S8YOXF4M'
+    '29EohgLvZ8iOsBME3osdYScIvLYdYTc2p/TbEXaSwGvZHQk7ScVr2e0IO8mM17Qj7AwCb9ttR9jJAq9px5WsLPAadr9cycrGlIYd'
+    'KWu2nfLzbkenkCbt0+6XsBN2i6cdnUKatA87UlbcLR52dApx0j7sSFlx0t7tSFlB0m7bdnRZSdK27UhZedLe7EhZi/H4Zse1rEXS'
+    '3uyYUGRJe2jYkbKypP152h3nSFmto+0/1ynlajdHudNZlsd9WXa1m6HcqTLLsmgD71LwrnYzlDt1pos38C4F72I3x3SXXVasgXeZ'
+    '8C52M5Q7dbVbxTzhXexmKHfl1S7apK33oa52FXYWzeJit5krZeNuFrXdcT67LObp+GL3PVfKxtto6+m4tvt13yqy2O2Km537VqHi'
+    'tzs3i9rO/Z7xI2WjbhYXu/nKXbzD8dXOfat4pmzEWylb7KbZuW+zZcMu4kY7i13WWEXUds5HFNW0i3hImcNu3bRbRW3nfEQpk4i7'
+    'Pz9z2DXpYh6O/2bORxSVhp3azmC3xs5NuYvbzvl4l6VhV2zc27VTNuYdPPd295TV2NmmbH5HjPfC4r/M8WWFerXLsZOmbIWdtd0j'
+    'ArGTp+y94WJnuu7dVT8ZY20Wf852M5W7h13EcbeZwy6vbk9+xhx3/7i1az3DE/nup2u78lnuHr/Q2EnL3eMXxJ08Ze+/Iu7s7XLs'
+    'xCmLneUFWTMKsROnbOwXFm7typeJDjvbcldEvvvp1O7txYC4d/CwC8TuNWUj38Fzaafe7BR2tikb+ZDi0m79bldiZ1nuIh9SHNp1'
+    'vbpIztrbEXfWKRv3kDKzncbONmUfcVdhJ7aLegfPnV3Z2VNjbrTO7LoPVyDu7O2ivs3ozK47ZaMe8JzbdV/j5tiJUzbqXSjXdhV2'
+    'rsoddgar7y1t7KzLXdQDniO7svf6IeIhxZFdhp3zlI36Fq0buzV2M5S7mButG7uB14zX8TZaJ3ZDh3tGfHvbid1AymI3wS7iIcWF'
+    '3fCZsvHufrqw04MnUsS7g+fCbjBlI34xyqXdYFQSd9IJJerh2IFdOfyqZ7y7UA7tquG4q7CTpmzEjwa4s+sb4OJ9bna6XTkWV9EO'
+    'x+7sxv6Cu0ar66+oq+XbjX9Ails7Hc7BepPtytHDKFwOeDqkk/Wc2VWjkTn9m1VZUMcSTrUz+EwjZzt4b3Se09aVnR4Pzco5nefm'
+    'PWqnL6tSur3uv2GSPYN/peNrPlbzD3WZda2Q7W445et3/voblWXcNUne/iN5t1cogTdmN/7djxeecvxuhvXKw7VbG/4Ig7VsYOe4'
+    'nGrns9UO26nSxU8wMOBNdSt9Ju2InZPM6Y+7aSlbs/lM2k/Y9Q9468npWi7errK0m1burvpx2/UPeJkDu2rZdiN5o/p28BR2o99+'
+    '3y3a9fTxxGejHZnvSpd2uePp7tJnw7VTpj+D1ZBSZtPnu3DtTH68fLTi9O3gTXbze0VruI8ytMaLtRp81yzLtcEqu/I1cDsXqyfu'
+    'RJuiqqtP+L2g/ahd1d1CbOyeZTRyu55dKNkNtD67Ig27VWckrURf49VulYhdbl/uXgfpR72rUrYz3gjp7LMew+5Ddp1M0ucFyo75'
+    'zutNRv92lfCLtMbydZWKXctJfsv7jU6f/wdEX+8KJ3brrmvB/HrxE7FdR36OPns2UvFuXGqltKcHyvzFncWjZY3bds9AK3Mdd86u'
+    '38Zglcntzv+qfk4hb2t5q3gfsnt/QcXd+426SCLu8vfCP91unYZdNqlV9OXxKm679xdUHD6FrJOwezsl34ndOm67os/ORZNUVdx2'
+    'rzt4pUO7yHtFn92i3wz9sF3+ksPYyQe8KE7++JSdws6VXYmdfMCLqFV8zK69g2fyNhB2w3YVdth9cMATPYmCXaddgZ10SBE+iZK8'
+    'nW4MKUGVO3V981SFH3eNhw6DKHet13VDtWvu4AVzJJ4SP/7r3S6U02Zsnp32Yvd8QSWQcqc6nwkP2W4VypHHqueB+hDtnkUuCDvV'
+    '+zZC0DkbwmSsBl7lCM/uMRyrEPbbp71s492uCpTOGO/jdlkVwJ6xGnkBKzS74sUuDzbsTAPvg3Z3M//lTo2++Reonf9DYVTHG5K5'
+    'BV6Kdj3vlubSrP2gnQrETvW+lSsMPG92eQhh9/auiyjw0rNT/XQtvIDtAkjZrrMQckHgfdCu3Swq7ynbfYxEmHatA+H8p2zfCRzm'
+    'Sesr7nLvYdd7ZIlx4Pmy06GGnSDwPmmnAyh3o2EnCLxP2q0Dshs8aChAO+W/3CkTu8wwaT3Z+S53mZFdFY5d4f9IZ6OwM01aT3aV'
+    '37AbO13NLGk/alf6PobdLGWfgReiXe43ZccP9TNKWj92K+ysB7wq7JQ1TNqP2qkwyp3JMaPB2uXYWdt5LndGx10bFDwvdhV21o3W'
+    'r53ZqcoGSevFLvxyF6xdjp31Fe3Kr53hZyMEZ1f6fFZWW9hV4djV98o0dtZ5U/i1M/3wgvDsPB5XF4FdgV0idho78Xh3bxbEnXy8'
+    'I+6m2OXYYYcddthhhx122C3imgy7+a/J2Asg7og79u+www47ud1y75MtZjgO79724uyIO4shRRN32HlotME9u7icRptjh52Hghfc'
+    'c+7YLd5uke/1hFLwlvg+GXYJJG2A788GY7fA97aDSdoFnhewlKTFzj5pAzwfZSlJG+K5PCHZLe08qJCSdmnnkC0j8MI8/24ZgRfm'
+    'uYuBBd6SzvsMzU5nCzpnNrCkXdL5xuEF3nLO1Q4w8BZznnuIgdcKvYA/RyBQPP0OZ0aXpt3456ZgZxh4C/i8ngUFXoGdbeBV2Nni'
+    'GdIla1dMp0vXblGfA7oUvAI727QtsLPEqwrsLPNW9q/TtmuHnvTfpm53XtUlWSv5P8TOfmGHHXbYYcfCDjvssGNhhx122GHHwg47'
+    '7LBjYYcddthhx8IOO+ywY2GHHXbYYcfCDjvssGNhhx122GGHHXbYYYcdCzvssMOOhR122GGHHQs77LDDjoUddthhhx0Lu3TsMm8L'
+    'Ozd269c/XGGHHXbYYYcddthhhx122GGHHXbYYYcddthhh93S7MJY2KV2nww77FjYYYcddizssMMOO+xY2GGHHXYs7LDDDjs3K4z7'
+    'ZBn3GLHDDjvssMMOO+ywww477LDDDjvssMMOO+ywwy5hO+71YMfCDjvssGNhhx122GHHwg477LBjYYcddthhx1qu3WLvk+2ws7Yj'
+    '7iztvv7LdhV2dnGHHXGHHXbp2P3+i52V3QY7e7u/2GHnxe74jZ2Nndpih50fu9MGOxu7Pz/YTbLzf2GxSLuvA3aT7PwPeIu025yC'
+    'sFvkutgFMKQscKktdtPsTtyhtVh/frCbaBfAzvHy1tfhYkejtWqzVzuahbUdjdaqzV7saBZWreJqR7OwaRU3O5qFuNzd7Wi0Nq3i'
+    'anek4EnL3fZuR7OwaRU3OwqeRau42VHwLMrdzY7pWD4Z3+0oeBbl7m7HdCwvd3c7tgNEKXspd3c7JjzxdPewO21IWkHK/rTsmFKk'
+    'E8rTjqSVTihPO5JWnLJPOy7LzFP28GLHpYVwQmnYkbTSlG3YkbTClG3Y0WlFg3HLjqQVpmzTjmtaUado2ZG0spRt2tEtRJ2ibUfg'
+    'icKuZUfgGYTdT4/dL4E3FnabU4/daUPgmQ4ob3aMKYKwe7Ej8ARh92pHxTMPu1c7As+0yXbYEXjGYfdmx4xndEnRbXdkO6WvUWxP'
+    'I3anHXNKzwbKYdTuSLvoztjXsOuwO7cLsrYjYzcnAzuy1ihju+2OG/DGM7bbjqw1ydgeu9MOvBe6g7HdGQ+w5gVFF12f3YmS1+wT'
+    '25PEjn4xStdrd8YjbYfp+u3Au9e6ProBuxqPbvvVTzdkV+Np6E5WdqfjLu2OoTab/cnSrp7z0g099bXpnusM7eq8TVOvltsO24zZ'
+    'nU77Wi+1pqFrucNpqt1Vb/OtqzQAK13DjcuZ2Z31dpu01v5goGJmVxe+/S4JwO12bwRX2/0P9BICjIUv9vYAAAAASUVORK5CYII='
+)
 
 
 class Monitor:
@@ -27,6 +110,9 @@ class Monitor:
     data from a simulation and stores it in a single output directory.
     Provides a live view to track the progress of the simulation and a convenience
     toggle-buttons window.
+    In asyncio programs, a Monitor can be used as an async context manager,
+    which calls afinalize() on exit:
+    async with Monitor('name') as mon: ...
 
     :param name: A name for the Monitor. Also used as the output directory name.
         By default, the output directory is given a name of the form "S#" where # is
@@ -40,9 +126,40 @@ class Monitor:
     :type enable_output_directory: bool, optional
     :param enable_toggles: Whether to open a toggles window for a convenient user control.
     :type enable_toggles: bool, optional
+    :param memory_budget: A limit for the memory taken up by the data of all trackers, either
+        in bytes or as a string such as '2GB' or '500MB'. If provided, trackers store their data
+        in fixed-size chunks, and when the budget is exceeded, the least recently used chunks are
+        spilled to binary files (under a 'chunks' directory in the output directory, or a temporary
+        directory if there's none). Spilled chunks are loaded back whenever they're needed.
+        Bounded (max_points) and memory-mapped trackers are not affected. Default is None (no limit).
+    :type memory_budget: int, str, optional
+    :param headless: Whether to run without any GUI, e.g. on a compute node with no display.
+        A headless Monitor doesn't open the toggles window or the live view, doesn't show plots,
+        and renders the plots saved by finalize() with the non-interactive Agg backend.
+        Toggles added with add_toggle() are never toggled. By default, a Monitor is headless
+        if there's no display to connect to (see _detect_headless()).
+    :type headless: bool, optional
+    :param mp_context: The multiprocessing context (or start method name, such as 'spawn' or 'forkserver')
+        used to start the helper process, which hosts both the toggles window and the live view.
+        Default is None (the default context).
+    :type mp_context: str, multiprocessing.context.BaseContext, optional
+    :param autosave_thread: If True, autosaved rows are handed to a dedicated writer thread through
+        a bounded queue, and are formatted and written there instead of in the updating thread
+        (see _AutosaveThread). Default is False.
+    :type autosave_thread: bool, optional
+    :param autosave_queue_size: The number of autosave batches (an update() row or an update_many() block)
+        the writer thread's queue holds. Default is 1000.
+    :type autosave_queue_size: int, optional
+    :param backpressure: What to do when the writer thread's queue is full: 'block' waits for room,
+        'coalesce' merges the new batch into a batch of the same tracker that's already queued, and
+        'spill' puts the new batches in a temporary file until the writer thread catches up.
+        Default is 'block'.
+    :type backpressure: str, optional
     """
 
-    def __init__(self, name=None, super_directory=None, enable_output_directory=True, enable_toggles=True):
+    def __init__(self, name=None, super_directory=None, enable_output_directory=True, enable_toggles=True,
+                 memory_budget=None, headless=None, mp_context=None, autosave_thread=False, autosave_queue_size=1000,
+                 backpressure='block'):
         """Constructor method
         """
         # create output directories
@@ -51,19 +168,47 @@ class Monitor:
             self.data_path = f'{self.dir_path}/data'
             _create_dir_path(self.data_path)
 
+        # share the memory budget between the chunks of all trackers
+        self.chunk_pool = None
+        if memory_budget is not None:
+            spill_dir = f'{self.dir_path}/chunks' if enable_output_directory else None
+            self.chunk_pool = _ChunkPool(_parse_size(memory_budget), spill_dir)
+
         self.titled_trackers = {}
         self.trackers = []  # a list of trackers for convenience
         self.ids = 0  # used to identify trackers
-        self.live_view_process = None
         self.live_view_queue = None
 
+        self.headless = _detect_headless() if headless is None else headless
+
+        # the helper process, which hosts the toggles window and the live view (see _Helper)
+        self._helper = None
+        self._mp_context = mp_context
+
         self.toggles = []
+        self._toggle_events = deque()  # presses of the default toggles, handled by tracker updates
+        self._toggles_enabled = enable_toggles
 
-        if enable_toggles:
+        if enable_toggles and not self.headless:
             toggles_window_title = name if name else 'Monitor toggles'
-            self.live_view_toggle = Toggle(None, desc='Toggle live view', window_title=toggles_window_title)
+            self.live_view_toggle = Toggle(None, desc='Toggle live view', window_title=toggles_window_title,
+                                           mp_context=mp_context)
+            self._helper = self.live_view_toggle.helper
             self.toggles.append(self.live_view_toggle)
             self.plot_toggle = self.add_toggle(name='Plot', desc='Plot data')
+            self.live_view_toggle.on_toggle(_default_toggle_callback(self._toggle_events, 'live_view'))
+            self.plot_toggle.on_toggle(_default_toggle_callback(self._toggle_events, 'plot'))
+
+        # a single thread that does the file writes and live view transport of async updates, in order
+        self._io_executor = None
+
+        # receives the rows sent by tracker handles in other processes (see Tracker.handle())
+        self._remote_receiver = None
+
+        # writes the autosaved rows of all trackers in the background
+        self._autosave_thread = None
+        if autosave_thread and enable_output_directory:
+            self._autosave_thread = _AutosaveThread(autosave_queue_size, backpressure)
 
         # save current time for the summary
         self._t0 = datetime.now()
@@ -71,7 +216,10 @@ class Monitor:
         self.monitor_vars = set()
         self.monitor_vars.update(set(vars(self).keys()))
 
-    def tracker(self, ind_var_name, *dep_var_names, title='no_title', autosave=False):
+    def tracker(self, ind_var_name, *dep_var_names, title='no_title', autosave=False, columnar=False,
+                max_points=None, dtype=None, expected_rows=None, memmap=False, record_every=None, min_interval=None,
+                min_delta=None, compression=None, tolerance=None, thread_safe=False, merge_order='arrival',
+                flush_every=1000, flush_interval=1.0, autosave_format='csv', durability='flush', fsync_every=1000):
         """Create a tracker object to track variables.
         A tracker is associated with one independent variable, and multiple dependent
         variables.
@@ -86,8 +234,89 @@ class Monitor:
         :param autosave: Enables autosave for the tracker. If True,
             each update() call appends the data into the output file.
             This ensures that the data won't be lost in case of
-            an unexpected termination. Default is False.
+            an unexpected termination. The rows are written through a buffer,
+            which is flushed according to flush_every and flush_interval. Default is False.
         :type autosave: bool, optional
+        :param columnar: If True, the tracker stores its data in one growable
+            numpy array per variable instead of a list of tuples. This is much lighter
+            on memory for long runs. Default is False.
+        :type columnar: bool, optional
+        :param max_points: If provided, only the most recent max_points rows are kept
+            in memory (columnar). Older rows are streamed to the tracker's output file, which
+            is completed by save() or finalize(). The live view and plot() only show
+            the rows in memory. Default is None (unbounded).
+        :type max_points: int, optional
+        :param dtype: A numpy data type to store the values with, such as 'float32', 'int32' or 'int64'.
+            Either a single data type for all variables, or a sequence of data types, one per
+            data label (independent variable first). Setting a data type makes the tracker columnar.
+            The data types are also recorded in the tracker's output file, so that load_from_dir()
+            restores them. Default is None (float64 for columnar trackers).
+        :type dtype: str, numpy.dtype, sequence, optional
+        :param expected_rows: The number of rows the tracker is expected to receive (e.g. the number
+            of simulation steps). Storage for this many rows is allocated up front, so that update()
+            never has to reallocate or copy the data. Setting it makes the tracker columnar.
+            It is also used by estimate_memory(). Default is None.
+        :type expected_rows: int, optional
+        :param memmap: If True, the tracker's columns live in a memory-mapped .mmap file in the
+            output directory, instead of in memory. The operating system then decides which parts
+            of the data stay in RAM, the data survives a crash, and load_from_dir() reopens the file
+            without parsing it. Since the data is already on disk, finalize() doesn't write a .csv
+            file for the tracker (save() still does). Ignored if the Monitor has no output directory.
+            Default is False.
+        :type memmap: bool, optional
+        :param record_every: Sampling policy: only record every record_every-th update (the first one included).
+            Default is None (record all updates).
+        :type record_every: int, optional
+        :param min_interval: Sampling policy: record at most one update per min_interval seconds
+            of wall-clock time. Default is None.
+        :type min_interval: float, optional
+        :param min_delta: Sampling policy: only record an update if its independent variable
+            differs by at least min_delta from the last recorded one. Default is None.
+        :type min_delta: float, optional
+        :param compression: Lossy compression of the tracked series, either 'deadband' or 'swinging_door'.
+            Only the rows needed to reconstruct each dependent variable within its tolerance are stored
+            (and autosaved and plotted). 'deadband' stores a row when a variable moves away from its last
+            stored value by more than the tolerance, which suits flat stretches. 'swinging_door' stores
+            the rows needed to reconstruct the series by linear interpolation, which also suits linear
+            stretches. Default is None (no compression).
+        :type compression: str, optional
+        :param tolerance: The error bound of the compression, either for all dependent variables or
+            a sequence with one per dependent variable. Required if compression is set.
+        :type tolerance: float, sequence, optional
+        :param thread_safe: Whether the tracker may be updated from multiple threads at once. If True, each thread
+            appends its rows to a buffer of its own, without any locking. The buffers are merged into the tracker
+            (and only then autosaved and sent to the live view) by an updating thread whenever a buffer holds
+            THREAD_BUFFER_SIZE rows or flush_interval seconds have passed since the last merge, and on save(),
+            plot(), columns() and finalize(). Rows buffered after the last update of all threads wait for one
+            of these. Sampling and compression are applied when the rows are merged. Default is False.
+        :type thread_safe: bool, optional
+        :param merge_order: The order of the rows merged from the thread buffers, either 'arrival'
+            (the order of the update() calls) or 'ind_var' (sorted by the independent variable).
+            Each merge is ordered on its own. Default is 'arrival'.
+        :type merge_order: str, optional
+        :param flush_every: The number of autosaved rows buffered before they're written to the output file.
+            Set it to 1 to write every row right away. Default is 1000.
+        :type flush_every: int, optional
+        :param flush_interval: The maximal time in seconds between writes of the autosave buffer,
+            checked whenever rows are autosaved. With thread_safe, it's also the maximal time between merges
+            of the thread buffers. None means no time limit. The buffer is also written
+            by flush(), save() and finalize(). Default is 1.0.
+        :type flush_interval: float, optional
+        :param autosave_format: The format of the tracker's output file, either 'csv' or 'binary'.
+            A binary .bin file holds fixed-width little-endian records, one per row, after a small header
+            with the data labels and data types. It's much faster to write and smaller than a .csv file,
+            a crash can at most cut off its last record, and load_from_dir() reads it without parsing.
+            It can be exported to a .csv file with export_csv(), or by finalize(export_csv=True).
+            Default is 'csv'.
+        :type autosave_format: str, optional
+        :param durability: How far the autosaved rows are pushed whenever the buffer is written:
+            'none' leaves them in the file object's own buffer, 'flush' hands them to the operating system,
+            so they survive a crash of the program, and 'fsync' also makes the operating system write them
+            to the disk every fsync_every rows, so they survive a power loss. Default is 'flush'.
+        :type durability: str, optional
+        :param fsync_every: With durability='fsync', the number of rows between the fsync() calls.
+            The buffer is written at least as often. Default is 1000.
+        :type fsync_every: int, optional
         :return: A tracker object that has an update() method.
         :rtype: Tracker
         """
@@ -100,7 +329,13 @@ class Monitor:
             dir_path = self.data_path + "/" + title
             _create_dir_path(dir_path)
 
-        tracker = Tracker(self, self.ids, dir_path, ind_var_name, *dep_var_names, autosave=autosave)
+        tracker = Tracker(self, self.ids, dir_path, ind_var_name, *dep_var_names, autosave=autosave,
+                          columnar=columnar, max_points=max_points, dtype=dtype, expected_rows=expected_rows,
+                          memmap=memmap, chunk_pool=self.chunk_pool, record_every=record_every,
+                          min_interval=min_interval, min_delta=min_delta, compression=compression,
+                          tolerance=tolerance, thread_safe=thread_safe, merge_order=merge_order,
+                          flush_every=flush_every, flush_interval=flush_interval, autosave_format=autosave_format,
+                          durability=durability, fsync_every=fsync_every)
 
         # increase self.ids
         self.ids += 1
@@ -123,19 +358,72 @@ class Monitor:
         :return: A new Toggle object that has the method toggled().
         :rtype: Toggle
         """
-        if not hasattr(self, 'live_view_toggle'):
+        if not self._toggles_enabled:
             raise ReferenceError("The toggles for this Monitor have been disabled.")
 
+        if self.headless:  # there's no window to press the toggle in
+            toggle = _InertToggle(name=name, desc=desc)
+            self.toggles.append(toggle)
+            return toggle
+
         toggle = Toggle(self.live_view_toggle, name=name, desc=desc)
         self.toggles.append(toggle)
         return toggle
 
+    def estimate_memory(self, rows=None):
+        """Estimate the memory the data of all trackers will take up.
+        See Tracker.estimate_memory() for how each tracker is estimated.
+        If the Monitor has a memory budget, the memory of chunked trackers is capped by it.
+
+        :param rows: The number of rows to estimate for trackers that don't
+            have expected_rows. If not provided, their current number of rows is used.
+        :type rows: int, optional
+        :return: The projected memory footprint in bytes.
+        :rtype: int
+        """
+        total = sum([tracker.estimate_memory(rows) for tracker in self.trackers
+                     if not isinstance(tracker.data, _ChunkedStore)])
+        chunked = sum([tracker.estimate_memory(rows) for tracker in self.trackers
+                       if isinstance(tracker.data, _ChunkedStore)])
+
+        # chunked trackers never take up more than the memory budget
+        if self.chunk_pool:
+            chunked = min(chunked, self.chunk_pool.budget)
+        return total + chunked
+
+    def memory_report(self, rows=None):
+        """Get a report of the projected memory footprint of all trackers,
+        which can be printed before a long run starts.
+
+        :param rows: The number of rows to estimate for trackers that don't
+            have expected_rows. If not provided, their current number of rows is used.
+        :type rows: int, optional
+        :return: A report with a line per tracker and a total.
+        :rtype: str
+        """
+        content = "-------------------\n" \
+                  "   Memory Report   \n" \
+                  "-------------------\n"
+        for title, trackers in self.titled_trackers.items():
+            for tracker in trackers:
+                name = '-'.join([tracker.ind_var_name] + tracker.dep_var_names)
+                if title != 'no_title':
+                    name = f'{title}/{name}'
+                content += f" - {name}: {_format_size(tracker.estimate_memory(rows))}\n"
+        content += f"Total: {_format_size(self.estimate_memory(rows))}"
+        return content
+
     def close_toggles(self):
         """Close all toggles. No need if finalize() is called.
         """
+        self._toggle_events.clear()  # presses that haven't been handled are dropped
+
         for toggle in self.toggles:
             toggle.close()
 
+        if self._helper and self._helper.finished:
+            self._helper = None
+
     def plot(self, *args):
         """Plot trackers or groups of trackers in a single figure.
         This method accepts multiple arguments representing plots, and shows
@@ -144,6 +432,10 @@ class Monitor:
         :param args: Either titles, Tracker objects, or iterables of Tracker objects.
         :type args: str, Tracker, iterable
         """
+        if self.headless:
+            warnings.warn("plot() has no effect in headless mode. The plots are saved by finalize().")
+            return
+
         # save current backend
         backend = matplotlib.get_backend()
         matplotlib.use('TkAgg')
@@ -155,42 +447,28 @@ class Monitor:
         matplotlib.use(backend)
 
     def open_live_view(self, update_rate=2):
-        """Open a live view of the Monitor in a different process.
+        """Open a live view of the Monitor in the helper process.
 
         :param update_rate: How many graph updates to perform in a second.
         :type update_rate: float, optional
         """
-        # make self less recursive by removing monitor
-        # reference from trackers
-        for trackers in self.titled_trackers.values():
-            for tracker in trackers:
-                tracker.monitor = None
-
-        # also, remove toggle objects temporarily
-        toggles = self.toggles
-        live_view_toggle = self.live_view_toggle
-        plot_toggle = self.plot_toggle
-        self.toggles = None
-        self.live_view_toggle = None
-        self.plot_toggle = None
+        if self.headless:
+            warnings.warn("The live view can't be opened in headless mode.")
+            return
 
-        # create a queue for communication
-        self.live_view_queue = Queue()
+        if self.live_view_queue:  # means that live view is already open
+            return
 
-        # create the process
-        self.live_view_process = Process(target=_live_view_process,
-                                         args=(self, self.live_view_queue, update_rate))
-        self.live_view_process.start()
+        # start a helper process if there's no toggles window
+        if self._helper is None:
+            self._helper = _Helper('Monitor', self._mp_context)
 
-        # restore monitor reference to trackers
-        for trackers in self.titled_trackers.values():
-            for tracker in trackers:
-                tracker.monitor = self
+        # send a copy of the monitor, pickled right away since
+        # the queue pickles its messages in the background
+        self._helper.open_live_view(pickle.dumps(self), update_rate)
 
-        # restore toggle objects
-        self.toggles = toggles
-        self.live_view_toggle = live_view_toggle
-        self.plot_toggle = plot_toggle
+        # trackers send their new values directly through the helper's queue
+        self.live_view_queue = self._helper.queue
 
     def close_live_view(self):
         """
@@ -200,12 +478,22 @@ class Monitor:
         if not self.live_view_queue:  # means that live view is closed
             return
 
-        self.live_view_queue.put(None)
-        self.live_view_process.join()
+        self._helper.close_live_view()
         self.live_view_queue = None
-        self.live_view_process = None
 
-    def finalize(self):
+        if self._helper.finished:
+            self._helper = None
+
+    def __getstate__(self):
+        # the copy sent to the live view has no toggles, processes or threads
+        state = vars(self).copy()
+        for name in ('toggles', 'live_view_toggle', 'plot_toggle', 'live_view_queue', '_helper', '_mp_context',
+                     '_io_executor', '_remote_receiver', '_autosave_thread'):
+            if name in state:
+                state[name] = None
+        return state
+
+    def finalize(self, export_csv=False):
         """Save all data tracked by this Monitor.
         This includes:
         - Config file
@@ -214,7 +502,13 @@ class Monitor:
         - Plots
         It also closes the live view and the toggles window.
 
+        :param export_csv: Whether to also export the binary output files of trackers
+            (see the autosave_format of tracker()) as .csv files. Default is False.
+        :type export_csv: bool, optional
         """
+        # receive the rows sent by tracker handles, and wait for the writes of async updates
+        self._close_remote()
+        self._close_io()
 
         # close live view
         self.close_live_view()
@@ -227,11 +521,137 @@ class Monitor:
             return
 
         # save tracked data
+        self._save_trackers(export_csv)
+
+        # save graphs
+        self._save_plots()
+
+        # save config file
+        self._save_config_file()
+
+        # save summary file
+        self._save_summary_file()
+
+    async def afinalize(self, export_csv=False):
+        """The async version of finalize(). Everything that
+        involves waiting for files or processes runs in a worker thread, so that
+        the event loop isn't blocked. Only the plots are made in the calling thread,
+        since matplotlib doesn't support making them in other threads.
+
+        :param export_csv: Whether to also export the binary output files of trackers
+            as .csv files (see finalize()). Default is False.
+        :type export_csv: bool, optional
+        """
+        # close live view (after the pending async updates and rows of tracker handles are sent to it)
+        await self._run_io(self._close_remote)
+        await self._run_io(self.close_live_view)
+
+        # close toggles
+        self.close_toggles()
+
+        if getattr(self, 'dir_path', False):
+            await self._run_io(self._save_trackers, export_csv)
+            self._save_plots()
+            await self._run_io(self._save_config_file)
+            await self._run_io(self._save_summary_file)
+
+        await asyncio.get_running_loop().run_in_executor(None, self._close_io)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.afinalize()
+
+    async def _run_io(self, function, *args):
+        """Helper to the async methods of Monitor and Tracker.
+        Runs a function in the I/O thread of the Monitor, and waits for it without blocking the event loop.
+        There's a single I/O thread, so functions run in the order they were passed.
+
+        :param function: A function to run.
+        :type function: callable
+        :param args: Arguments for the function.
+        :return: The return value of the function.
+        """
+        if self._io_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='simmon-io')
+        return await asyncio.get_running_loop().run_in_executor(self._io_executor, function, *args)
+
+    def _close_remote(self):
+        """Receive the rows that tracker handles have already sent, and stop receiving.
+        """
+        if self._remote_receiver:
+            self._remote_receiver.close()
+            self._remote_receiver = None
+
+    def _close_io(self):
+        """Wait for everything passed to the I/O thread and stop it.
+        """
+        if self._io_executor:
+            self._io_executor.shutdown(wait=True)
+            self._io_executor = None
+
+    def _save_trackers(self, export_csv=False):
+        """Helper to finalize(). Saves the data of all trackers that isn't saved yet.
+
+        :param export_csv: Whether to also export binary output files as .csv files.
+        :type export_csv: bool, optional
+        """
+        # write everything queued for the writer thread first. An error it kept is raised
+        # only after all trackers are saved, so that one bad write doesn't lose the others
+        error = None
+        if self._autosave_thread:
+            try:
+                self._autosave_thread.close()
+            except Exception as thread_error:
+                error = thread_error
+            self._autosave_thread = None
+
         for trackers in self.titled_trackers.values():
             for tracker in trackers:
-                if not tracker.autosave:
+                tracker.flush()
+                if isinstance(tracker.data, _MemmapStore):
+                    tracker.data.flush()  # the data is already in its memory-mapped file
+                elif not tracker.autosave:
                     tracker.save()
 
+                if tracker._writer:
+                    tracker._writer.close()
+
+                if export_csv and tracker.autosave_format == 'binary' and getattr(tracker, 'path', False):
+                    tracker.export_csv()
+
+        if error is not None:
+            raise error
+
+    def autosave_metrics(self):
+        """Get metrics of the autosave writer thread (see autosave_thread), which show
+        whether the disk keeps up with the trackers:
+        - 'queue_depth': the number of batches waiting to be written, including spilled ones.
+        - 'max_queue_depth': the largest number of batches that have waited in the queue at once.
+        - 'lag': the time in seconds since the oldest batch that hasn't been written yet was queued.
+        - 'rows_written': the number of rows written so far.
+        - 'blocked_seconds': the total time updates have waited for room in the queue ('block').
+        - 'coalesced_batches': the number of batches merged into queued ones ('coalesce').
+        - 'spilled_batches': the number of batches put in the spill file ('spill').
+
+        :return: A dictionary of metrics, or None if there's no writer thread.
+        :rtype: dict, None
+        """
+        if not self._autosave_thread:
+            return None
+        return self._autosave_thread.metrics()
+
+    def _save_plots(self):
+        """Helper to finalize(). Saves the graphs of all trackers, one per title
+        and one per untitled tracker.
+        """
+        # in headless mode, render with a backend that doesn't need a display
+        backend = matplotlib.get_backend()
+        if self.headless:
+            matplotlib.use('Agg')
+
         # save group graphs
         plots_path = f'{self.dir_path}/plots'
         _create_dir_path(plots_path)
@@ -247,22 +667,26 @@ class Monitor:
                 figure.savefig(f'{plots_path}/'
                                f'{_determine_tracker_filename(tracker, plots_path, ".png")}', bbox_inches='tight')
 
-        # save config file
-        self._save_config_file()
-
-        # save summary file
-        self._save_summary_file()
+        if self.headless:
+            try:
+                matplotlib.use(backend)
+            except ImportError:  # the previous backend can't be used without a display
+                pass
 
-    def load_from_dir(self, dir_path=None):
+    def load_from_dir(self, dir_path=None, columnar=False):
         """Load data stored in a Monitor's output directory.
         This can be used to resume a terminated monitored process.
         The data being loaded is:
         - Config variables.
-        - Tracker objects including titles.
+        - Tracker objects including titles and data types.
+        Output files of trackers that were cut off by a crash are recovered first:
+        a partial last row is removed from them (see _recover_output_file()).
 
         :param dir_path: The data is loaded
             from this directory if provided. Otherwise, data is loaded from self.dir_path.
         :type dir_path: str, optional
+        :param columnar: Whether the loaded trackers should be columnar (see tracker()).
+        :type columnar: bool, optional
         """
         if not dir_path:
             if not getattr(self, 'dir_path', False):  # if no files
@@ -272,20 +696,19 @@ class Monitor:
         data_path = f'{dir_path}/data'
         config_path = f'{dir_path}/config.txt'
 
+        # files of this Monitor's own directory may be used in place
+        own = bool(getattr(self, 'dir_path', False)) and path.realpath(dir_path) == path.realpath(self.dir_path)
+
         # load data
         if path.exists(data_path):
             data_content = next(walk(data_path), [()] * 3)
             for title in data_content[1]:  # dir names
                 group_path = f'{data_path}/{title}'
                 for tracker_filename in next(walk(group_path), [()] * 3)[2]:
-                    labels = tracker_filename.replace('+', '').replace('.csv').split('-')
-                    tracker = self.tracker(labels[0], *labels[1:], title=title)
-                    _load_to_tracker(tracker, f'{group_path}/{tracker_filename}')
+                    self._load_tracker_file(f'{group_path}/{tracker_filename}', title, columnar, own)
 
             for no_title_filename in data_content[2]:  # file names
-                labels = no_title_filename.replace('+', '').replace('.csv', '').split('-')
-                tracker = self.tracker(labels[0], *labels[1:])
-                _load_to_tracker(tracker, f'{data_path}/{no_title_filename}')
+                self._load_tracker_file(f'{data_path}/{no_title_filename}', 'no_title', columnar, own)
 
         # load config
         if path.exists(config_path):
@@ -301,6 +724,59 @@ class Monitor:
 
                         vars(self)[attr_name] = attr_value
 
+    def _load_tracker_file(self, tracker_path, title, columnar, own=False):
+        """Helper to load_from_dir().
+        Creates a tracker out of a single output data file and loads the data into it.
+        A .csv file is parsed, a binary .bin file is read as is (see _read_binary_file()),
+        and a memory-mapped .mmap file of this Monitor's own directory is simply reopened
+        (no matter its size), and the tracker keeps working on it. The data of a .mmap file
+        of another directory is copied into a new memory-mapped file of this Monitor
+        (or into memory, if it has no output directory), so that the other file isn't changed.
+        Files of other types are ignored.
+
+        :param tracker_path: Path to the data file.
+        :type tracker_path: str
+        :param title: The title of the tracker.
+        :type title: str
+        :param columnar: Whether a tracker loaded from a .csv file should be columnar.
+        :type columnar: bool
+        :param own: Whether the file is in this Monitor's output directory. Default is False.
+        :type own: bool, optional
+        """
+        filename, ending = path.splitext(path.basename(tracker_path))
+        labels = filename.replace('+', '').split('-')
+
+        # a .csv file exported from a binary file holds the same data
+        if ending == '.csv' and path.exists(path.splitext(tracker_path)[0] + '.bin'):
+            return
+
+        if ending == '.csv':
+            _recover_output_file(tracker_path)
+            _merge_spool(tracker_path)  # rows that couldn't be autosaved before the monitor was stopped
+            tracker = self.tracker(labels[0], *labels[1:], title=title, columnar=columnar,
+                                   dtype=_read_csv_dtypes(tracker_path))
+            _load_to_tracker(tracker, tracker_path)
+
+        elif ending == '.bin':
+            _recover_output_file(tracker_path)
+            _merge_spool(tracker_path)
+            labels, columns = _read_binary_file(tracker_path)
+            tracker = self.tracker(labels[0], *labels[1:], title=title,
+                                   dtype=[column.dtype for column in columns])
+            if len(columns[0]):
+                tracker._extend_data(columns)
+
+        elif ending == '.mmap':
+            store = _MemmapStore(tracker_path)
+            if own:
+                tracker = self.tracker(labels[0], *labels[1:], title=title, dtype=store.dtypes)
+                tracker.data = store
+                tracker.memmap_path = tracker_path
+            else:
+                tracker = self.tracker(labels[0], *labels[1:], title=title, dtype=store.dtypes, memmap=True)
+                if len(store):
+                    tracker._extend_data(store.columns())
+
     def _save_config_file(self):
         """Save attributes added to this object.
         These attributes are considered "configurations" and
@@ -314,7 +790,7 @@ class Monitor:
             if var_name not in self.monitor_vars:
                 content += f"{var_name}: {str(var)}\n"
 
-        with open(self.dir_path + "/config.txt", 'w') as file:
+        with _atomic_open(self.dir_path + "/config.txt") as file:
             file.write(content[:-1])
 
     def _save_summary_file(self):
@@ -343,7 +819,7 @@ class Monitor:
             n_untitled = len(self.titled_trackers['no_title'])
             content += f" - {n_untitled} output file{'s' if n_untitled - 1 else ''} of untitled trackers."
 
-        with open(self.dir_path + "/summary.txt", 'w') as file:
+        with _atomic_open(self.dir_path + "/summary.txt") as file:
             file.write(content)
 
 
@@ -358,9 +834,16 @@ class QuietMonitor(Monitor):
     :type name: str, optional
     :param enable_toggles: Whether to open a toggles window for a convenient user control.
     :type enable_toggles: bool, optional
+    :param memory_budget: A limit for the memory taken up by the data of all trackers (see Monitor).
+    :type memory_budget: int, str, optional
+    :param headless: Whether to run without any GUI (see Monitor). By default, detected automatically.
+    :type headless: bool, optional
+    :param mp_context: The multiprocessing context used to start the helper process (see Monitor).
+    :type mp_context: str, multiprocessing.context.BaseContext, optional
     """
-    def __init__(self, name=None, enable_toggles=True):
-        super().__init__(name=name, enable_output_directory=False, enable_toggles=enable_toggles)
+    def __init__(self, name=None, enable_toggles=True, memory_budget=None, headless=None, mp_context=None):
+        super().__init__(name=name, enable_output_directory=False, enable_toggles=enable_toggles,
+                         memory_budget=memory_budget, headless=headless, mp_context=mp_context)
 
 
 class Tracker:
@@ -389,9 +872,56 @@ class Tracker:
     :param autosave: If True, this means that for each update() call, the Tracker will
         also update the output file with the new data received.
     :type autosave: bool
+    :param columnar: If True, the data is stored in a _ColumnStore (one numpy array
+        per variable) instead of a list of tuples.
+    :type columnar: bool
+    :param max_points: If provided, the data is stored in a _RingStore that only keeps
+        the most recent max_points rows in memory. Older rows are streamed to the output file.
+    :type max_points: int, optional
+    :param dtype: A numpy data type for all variables, or a sequence of data types, one per variable.
+        If provided, the data is stored in a _ColumnStore (or _RingStore) with these data types.
+    :type dtype: str, numpy.dtype, sequence, optional
+    :param expected_rows: If provided, the data is stored in a _ColumnStore with room for
+        this many rows allocated up front.
+    :type expected_rows: int, optional
+    :param memmap: If True, the data is stored in a _MemmapStore, in a .mmap file under dir_path.
+    :type memmap: bool
+    :param chunk_pool: If provided (and the tracker is neither memory-mapped nor bounded), the data
+        is stored in a _ChunkedStore, whose chunks are managed by this pool.
+    :type chunk_pool: _ChunkPool, optional
+    :param record_every: Sampling policy: only record every record_every-th update (see _Sampler).
+    :type record_every: int, optional
+    :param min_interval: Sampling policy: record at most one update per min_interval seconds.
+    :type min_interval: float, optional
+    :param min_delta: Sampling policy: only record an update if its independent variable
+        differs by at least min_delta from the last recorded one.
+    :type min_delta: float, optional
+    :param compression: Lossy compression mode, 'deadband' or 'swinging_door' (see _Compressor).
+    :type compression: str, optional
+    :param tolerance: The error bound of the compression, for all or for each dependent variable.
+    :type tolerance: float, sequence, optional
+    :param thread_safe: Whether the tracker may be updated from multiple threads, through per-thread buffers.
+    :type thread_safe: bool, optional
+    :param merge_order: The order of merged thread buffers, either 'arrival' or 'ind_var'.
+    :type merge_order: str, optional
+    :param flush_every: The number of rows the output file's buffer holds before it's written (see _AutosaveWriter).
+    :type flush_every: int, optional
+    :param flush_interval: The maximal time in seconds between writes of the output file's buffer,
+        and between merges of the thread buffers.
+    :type flush_interval: float, optional
+    :param autosave_format: The format of the output file, either 'csv' or 'binary' (see _binary_header()).
+    :type autosave_format: str, optional
+    :param durability: The durability of the output file's writes, 'none', 'flush' or 'fsync' (see _AutosaveWriter).
+    :type durability: str, optional
+    :param fsync_every: With durability='fsync', the number of rows between the fsync() calls.
+    :type fsync_every: int, optional
     """
 
-    def __init__(self, monitor: Monitor, _id: float, dir_path: str, ind_var_name: str, *dep_var_names, autosave=False):
+    def __init__(self, monitor: Monitor, _id: float, dir_path: str, ind_var_name: str, *dep_var_names, autosave=False,
+                 columnar=False, max_points=None, dtype=None, expected_rows=None, memmap=False, chunk_pool=None,
+                 record_every=None, min_interval=None, min_delta=None, compression=None, tolerance=None,
+                 thread_safe=False, merge_order='arrival', flush_every=1000, flush_interval=1.0,
+                 autosave_format='csv', durability='flush', fsync_every=1000):
 
         self._id = _id
         self.dir_path = dir_path
@@ -407,11 +937,86 @@ class Tracker:
         self.monitor = monitor
         self.ind_var_name = ind_var_name
         self.dep_var_names = list(dep_var_names)
-        self.data = []
+        self.dtypes = _normalize_dtypes(dtype, 1 + len(dep_var_names))
+        self.expected_rows = expected_rows
+        self._recorders = []  # flush functions of the tracker's recorders
         self.autosave = autosave
 
-        if autosave:
-            self.path = dir_path + '/' + _determine_tracker_filename(self, self.dir_path, '.csv')
+        self.sampler = None
+        if record_every or min_interval or min_delta:
+            self.sampler = _Sampler(record_every, min_interval, min_delta)
+
+        self.compressor = None
+        if compression:
+            self.compressor = _Compressor(compression, tolerance, len(dep_var_names))
+
+        if merge_order not in ('arrival', 'ind_var'):
+            raise ValueError(f"Invalid merge_order '{merge_order}'! Use either 'arrival' or 'ind_var'.")
+        self.merge_order = merge_order
+
+        # with thread_safe, every thread appends its rows to a buffer of its own,
+        # and the buffers are merged at least every flush_interval seconds
+        self._merge_interval = flush_interval
+        self._thread_buffers = None
+        self._merge_lock = nullcontext()
+        if thread_safe:
+            self._enable_thread_safety()
+
+        if autosave_format not in ('csv', 'binary'):
+            raise ValueError(f"Invalid autosave_format '{autosave_format}'! Use either 'csv' or 'binary'.")
+        self.autosave_format = autosave_format
+
+        # rows appended to the output file go through a buffered writer
+        self._writer = None
+        if autosave or (max_points and dir_path):
+            ending = '.bin' if autosave_format == 'binary' else '.csv'
+            self.path = dir_path + '/' + _determine_tracker_filename(self, self.dir_path, ending)
+            record_dtype = None
+            if autosave_format == 'binary':
+                record_dtype = _binary_record_dtype(self.dtypes or [np.float64] * (1 + len(dep_var_names)))
+            self._writer = _AutosaveWriter(self.path, flush_every, flush_interval, monitor._autosave_thread,
+                                           record_dtype, durability, fsync_every)
+            weakref.finalize(self, self._writer.close)  # write the buffer even if finalize() isn't called
+
+        if memmap and max_points:
+            raise ValueError("A tracker cannot be both memory-mapped and bounded (max_points).")
+
+        spill = None
+        if memmap and dir_path:
+            self.memmap_path = dir_path + '/' + _determine_tracker_filename(self, self.dir_path, '.mmap')
+            self.data = _MemmapStore(self.memmap_path, 1 + len(dep_var_names),
+                                     capacity=expected_rows or 1024, dtypes=self.dtypes)
+        elif max_points:
+            # evicted rows are streamed to the output file, unless autosave already put them there
+            spill = self._spill if dir_path and not autosave else None
+            self.data = _RingStore(1 + len(dep_var_names), max_points, spill=spill, dtypes=self.dtypes)
+        elif chunk_pool:
+            self.data = _ChunkedStore(1 + len(dep_var_names), chunk_pool, dtypes=self.dtypes)
+        elif columnar or self.dtypes or expected_rows or memmap:
+            self.data = _ColumnStore(1 + len(dep_var_names), capacity=expected_rows or 16, dtypes=self.dtypes)
+        else:
+            self.data = []
+
+        # create the output file right away (with its header, if it has one), which makes sure
+        # that no other tracker claims its filename, even though rows are only written to it later
+        # (atomically, so that a crash never leaves a partial header)
+        if getattr(self, 'path', False) and autosave_format == 'binary':
+            with _atomic_open(self.path, 'wb') as out_file:
+                out_file.write(_binary_header([ind_var_name, *dep_var_names], self._writer.record_dtype))
+        elif getattr(self, 'path', False):
+            with _atomic_open(self.path) as out_file:
+                out_file.write(_csv_header(self.dtypes))
+
+    def __getstate__(self):
+        # recorders and thread buffers stay with the original tracker (e.g. when sent to the live view process)
+        state = vars(self).copy()
+        state['_recorders'] = []
+        for name in ('_thread_local', '_arrivals'):
+            state.pop(name, None)
+        state['_thread_buffers'] = None
+        state['_merge_lock'] = nullcontext()
+        state['_writer'] = None
+        return state
 
     def update(self, ind_var, *dep_vars):
         """Update tracker's data. If autosave is enabled
@@ -419,6 +1024,7 @@ class Tracker:
         The data provided here should match the data labels used to create the Tracker:
         - The number of values should be equal to the number of data labels.
         - The order of the values should match the order of the data labels, i.e. ind_var, dep_var1, dep_var2 ...
+        If the tracker has a sampling policy, updates rejected by it return right away.
 
 
         :param ind_var: A new value for the independent variable.
@@ -426,281 +1032,2440 @@ class Tracker:
         :param dep_vars: New values for all dependent variables.
         :type dep_vars: float
         """
+        if self._thread_buffers is not None:
+            self._buffer_row(ind_var, dep_vars)
+            return
+
+        if self.sampler and not self.sampler.accept(ind_var):
+            return
+
         if len(dep_vars) != len(self.dep_var_names):
             raise Exception(f"Amount of data values ({1 + len(dep_vars)}) is "
                             f"different than the amount of data labels ({len(self.dep_var_names) + 1}).")
 
         curr_data = (ind_var, *dep_vars)
+
+        # with compression, a row is only stored when it's needed to reconstruct the series
+        if self.compressor:
+            for row in self.compressor.push(curr_data):
+                self._add_row(row)
+            return
+
+        self._add_row(curr_data)
+
+    async def aupdate(self, ind_var, *dep_vars):
+        """The async version of update(). The update is done in the monitor's I/O thread
+        (in order), so the event loop isn't blocked by file writes. It goes through update()
+        itself, so the validation, locking and thread_safe buffering are exactly the same.
+        The monitor toggles are refreshed afterwards, in the calling thread.
+
+        :param ind_var: A new value for the independent variable.
+        :type ind_var: float
+        :param dep_vars: New values for all dependent variables.
+        :type dep_vars: float
+        """
+        await self.monitor._run_io(self.update, ind_var, *dep_vars)
+
+        # refresh monitor toggles, if any have been pressed (update() doesn't in the I/O thread)
+        if self.monitor._toggle_events and threading.current_thread() is threading.main_thread():
+            _refresh_monitor_toggles(self.monitor)
+
+    def _add_row(self, curr_data):
+        """Helper to update(). Stores a single validated row,
+        autosaves it, sends it to the live view and refreshes the monitor toggles (in the main thread).
+
+        :param curr_data: A row of values, one per data label.
+        :type curr_data: tuple
+        """
         self.data.append(curr_data)
 
         # save if autosave is enabled
         if self.autosave:
-            self._append_to_out_file(','.join([str(v) for v in self.data[-1]]))
+            self._writer.write_rows([self.data[-1]])
 
         # update the live view queue if exists
         if self.monitor.live_view_queue:
             self.monitor.live_view_queue.put((self._id, curr_data))
 
-        # refresh monitor toggles
-        _refresh_monitor_toggles(self.monitor)
+        # refresh monitor toggles, if any have been pressed. Only in the main thread, since
+        # plotting and opening the live view must not happen in a background thread
+        if self.monitor._toggle_events and threading.current_thread() is threading.main_thread():
+            _refresh_monitor_toggles(self.monitor)
+
+    def update_many(self, ind_vars, *dep_vars):
+        """Update tracker's data with a whole block of values at once.
+        This is equivalent to calling update() for each row of the block, but the
+        values are validated once, appended together, written to the output file
+        in a single operation (if autosave is enabled) and sent to the live view
+        as a single message.
+        The block can be given either column by column, i.e. update_many(xs, ys1, ys2 ...),
+        or as a single 2-D array-like with one row per update and one column per data label.
+        If the tracker has a sampling policy, only the rows it accepts are added. Since a block
+        arrives all at once, at most one of its rows passes a min_interval policy.
+
+        :param ind_vars: Values of the independent variable, or a 2-D block of all values.
+        :type ind_vars: array-like
+        :param dep_vars: Values of all dependent variables, one array-like per variable.
+        :type dep_vars: array-like
+        """
+        if dep_vars:
+            columns = [np.asarray(values) for values in (ind_vars, *dep_vars)]
+        else:
+            block = np.asarray(ind_vars)
+            if block.ndim != 2:
+                raise ValueError(f"A single block passed to update_many() must be 2-D, "
+                                 f"not {block.ndim}-D.")
+            columns = list(block.T)
+
+        if len(columns) != len(self.dep_var_names) + 1:
+            raise Exception(f"Amount of data columns ({len(columns)}) is "
+                            f"different than the amount of data labels ({len(self.dep_var_names) + 1}).")
+
+        if any(column.ndim != 1 or len(column) != len(columns[0]) for column in columns):
+            raise ValueError("All data columns passed to update_many() must be 1-D and of the same length.")
+
+        if self._thread_buffers is not None:
+            with self._merge_lock:
+                self._merge_threads()  # keep the rows buffered before this block ahead of it
+                self._add_columns(columns, refresh_toggles=threading.current_thread() is threading.main_thread())
+            return
+
+        self._add_columns(columns)
+
+    def _add_columns(self, columns, refresh_toggles=True):
+        """Helper to update_many(). Adds a validated block of columns:
+        applies the sampling policy and the compression, appends the data, autosaves it,
+        sends it to the live view and refreshes the monitor toggles.
+
+        :param columns: Equal-length 1-D numpy arrays, one per data label.
+        :type columns: list
+        :param refresh_toggles: Whether to refresh the monitor toggles, which should
+            only happen in the main thread.
+        :type refresh_toggles: bool, optional
+        """
+        if self.sampler:
+            mask = self.sampler.select(columns[0])
+            if not mask.all():
+                columns = [column[mask] for column in columns]
+
+        if self.compressor and len(columns[0]):
+            rows = [row for curr_data in zip(*[column.tolist() for column in columns])
+                    for row in self.compressor.push(curr_data)]
+            columns = [np.asarray(column) for column in zip(*rows)] if rows else [columns[0][:0]]
+
+        if not len(columns[0]):
+            return
+
+        if self.dtypes:
+            columns = [column.astype(dtype, copy=False) for column, dtype in zip(columns, self.dtypes)]
+
+        self._extend_data(columns)
+
+        # save if autosave is enabled
+        if self.autosave:
+            self._writer.write_columns(columns)
+
+        # update the live view queue if exists. The queue pickles its messages in the background,
+        # and the columns might be views of arrays that change before that (e.g. a reused buffer)
+        if self.monitor.live_view_queue:
+            self.monitor.live_view_queue.put((self._id, [np.array(column) for column in columns]))
+
+        # refresh monitor toggles, if any have been pressed
+        if refresh_toggles and self.monitor._toggle_events:
+            _refresh_monitor_toggles(self.monitor)
+
+    def _buffer_row(self, ind_var, dep_vars):
+        """Helper to update() of a thread-safe tracker.
+        Appends a row to the buffer of the calling thread, along with its arrival number.
+        When the buffer is full, or flush_interval seconds have passed since the last merge,
+        the calling thread merges all buffers into the tracker, unless another thread is already doing so.
+
+        :param ind_var: A new value for the independent variable.
+        :type ind_var: float
+        :param dep_vars: New values for all dependent variables.
+        :type dep_vars: tuple
+        """
+        if len(dep_vars) != len(self.dep_var_names):
+            raise Exception(f"Amount of data values ({1 + len(dep_vars)}) is "
+                            f"different than the amount of data labels ({len(self.dep_var_names) + 1}).")
+
+        buffer = getattr(self._thread_local, 'buffer', None)
+        if buffer is None:  # first update from this thread
+            buffer = self._thread_local.buffer = []
+            with self._merge_lock:
+                self._thread_buffers.append(buffer)
+
+        buffer.append((next(self._arrivals), ind_var, *dep_vars))
+
+        # merge in time for the autosave and the live view, even if the buffers fill up slowly
+        due = self._merge_interval is not None and time.monotonic() - self._last_merge >= self._merge_interval
+        if (due or len(buffer) >= THREAD_BUFFER_SIZE) and self._merge_lock.acquire(blocking=False):
+            try:
+                self._merge_threads()
+            finally:
+                self._merge_lock.release()
+
+    def _enable_thread_safety(self):
+        """Make the tracker thread-safe, with a buffer per thread (see _buffer_row()).
+        """
+        if self._thread_buffers is not None:
+            return
+
+        self._thread_local = threading.local()
+        self._merge_lock = threading.RLock()
+        self._arrivals = itertools.count()  # next() is atomic, so it orders the rows of all threads
+        self._thread_buffers = []
+        self._last_merge = time.monotonic()
+
+    def _merge_threads(self):
+        """Merge the rows buffered by all threads into the tracker (see _buffer_row()),
+        ordered according to merge_order.
+        Threads may keep appending to their buffers meanwhile: only the rows that are
+        in a buffer when it's taken are removed from it.
+        """
+        if self._thread_buffers is None:
+            return
+
+        with self._merge_lock:
+            self._last_merge = time.monotonic()
+            rows = []
+            for buffer in self._thread_buffers:
+                n_rows = len(buffer)
+                rows.extend(buffer[:n_rows])
+                del buffer[:n_rows]
+
+            if not rows:
+                return
+
+            rows.sort(key=(lambda row: (row[1], row[0])) if self.merge_order == 'ind_var' else (lambda row: row[0]))
+            columns = [np.asarray(column) for column in zip(*rows)][1:]  # drop the arrival numbers
+            self._add_columns(columns, refresh_toggles=threading.current_thread() is threading.main_thread())
+
+    def recorder(self, buffer_size=10000):
+        """Get a low-overhead function for recording rows in the innermost loop
+        of a simulation. The function is called just like update(), but all of the work
+        update() does per call is resolved once: each call only appends its values to
+        a buffer. When the buffer holds buffer_size rows, they are added to the tracker
+        with a single update_many() call, which validates them, appends them, autosaves them,
+        sends them to the live view and refreshes the monitor toggles.
+        Call the flush() attribute of the returned function to add the buffered rows
+        to the tracker before the buffer is full. save() and Monitor.finalize() flush
+        all recorders of the tracker automatically.
+
+        Usage::
+
+            record = tracker.recorder()
+            for i in range(n):
+                record(t, v)
+            record.flush()
+
+        :param buffer_size: The number of rows to buffer before adding them to the tracker.
+            The toggles and live view are only refreshed once per buffer_size rows.
+        :type buffer_size: int, optional
+        :return: A function that records a row, with a flush() attribute.
+        :rtype: function
+        """
+        # the values are buffered in a single flat list, which avoids creating
+        # a tuple per row (and the garbage collection work that comes with it)
+        values_buffer = []
+        extend = values_buffer.extend
+        n_columns = 1 + len(self.dep_var_names)
+        buffer_length = buffer_size * n_columns
+
+        def flush():
+            if values_buffer:
+                if len(values_buffer) % n_columns:
+                    values_buffer.clear()
+                    raise Exception(f"A recorder of this tracker was called with a wrong amount of data values. "
+                                    f"Each call should pass {n_columns} values.")
+
+                columns = [values_buffer[i::n_columns] for i in range(n_columns)]
+                values_buffer.clear()
+                self.update_many(*columns)
+
+        def record(*values):
+            extend(values)
+            if len(values_buffer) >= buffer_length:
+                flush()
+
+        record.flush = flush
+        self._recorders.append(flush)
+        return record
+
+    def handle(self, batch_size=1000):
+        """Get a handle for updating this tracker from other processes, such as the workers
+        of a ProcessPoolExecutor. The handle can be pickled and passed to the workers, and has
+        update(), update_many() and flush() methods, just like a tracker. It buffers the rows and
+        sends them to this process in batches of batch_size rows, where they are added to this
+        tracker as if they had been recorded here: they're autosaved, sent to the live view, and
+        saved by finalize().
+        The rows are received by a background thread, so this tracker becomes thread-safe
+        (see the thread_safe option of Monitor.tracker()).
+        A handle sends its remaining rows when flush() is called, when it's used as a context
+        manager and the block ends, or when it's garbage collected (e.g. when a task that
+        received it returns). Rows sent before finalize() is called are all added.
+
+        Usage::
+
+            handle = tracker.handle()
+            with ProcessPoolExecutor() as executor:
+                executor.map(simulate, [handle] * n_tasks, range(n_tasks))
+            monitor.finalize()
+
+        :param batch_size: The number of rows sent at once. Default is 1000.
+        :type batch_size: int, optional
+        :return: A picklable handle to this tracker.
+        :rtype: TrackerHandle
+        """
+        if self.monitor._remote_receiver is None:
+            self.monitor._remote_receiver = _RemoteReceiver()
+        receiver = self.monitor._remote_receiver
+
+        self._enable_thread_safety()  # rows also arrive from the receiver thread
+        receiver.trackers[self._id] = self
+        return TrackerHandle(self._id, 1 + len(self.dep_var_names), receiver.address, receiver.authkey, batch_size)
+
+    def flush_recorders(self):
+        """Add the rows buffered by all recorders of this tracker (see recorder()) to its data.
+        """
+        for flush in self._recorders:
+            flush()
+
+    def flush(self):
+        """Add all pending rows to the tracker's data. These are the rows buffered by
+        recorders (see recorder()), and with compression, the last row received, which the
+        compressor holds back until it knows whether it's needed. For a thread-safe tracker,
+        these are also the rows in the buffers of all threads. With autosave, the rows
+        buffered for the output file are written to it as well. save() and Monitor.finalize()
+        call this automatically.
+        """
+        with self._merge_lock:
+            self._merge_threads()
+            self.flush_recorders()
+
+            if self.compressor:
+                row = self.compressor.flush()
+                if row is not None:
+                    self._add_row(row)
+
+            if self._writer:
+                self._writer.flush()
+
+    def estimate_memory(self, rows=None):
+        """Estimate the memory this tracker's data will take up.
+        The estimate is made for expected_rows rows if it was provided, for the
+        given number of rows otherwise, and for the current number of rows if neither is
+        known. A bounded tracker (see max_points) never takes up more than its fixed buffers.
+        For a list-based tracker, the estimate includes the Python objects of each row.
+
+        For a memory-mapped tracker, the estimate is the size of its file mapping, as an upper bound.
+
+        :param rows: The number of rows to estimate for, if expected_rows wasn't provided.
+        :type rows: int, optional
+        :return: The projected memory footprint in bytes.
+        :rtype: int
+        """
+        rows = self.expected_rows or rows or len(self.data)
+        n_columns = 1 + len(self.dep_var_names)
+
+        if isinstance(self.data, (_RingStore, _MemmapStore)):
+            # a memory-mapped tracker's data is paged in and out by the operating system
+            return sum([column.nbytes for column in self.data._columns])
+
+        if isinstance(self.data, _ChunkedStore):
+            row_size = sum([dtype.itemsize for dtype in self.data.dtypes])
+            return -(-rows // self.data.chunk_rows) * self.data.chunk_rows * row_size
+
+        if isinstance(self.data, _ColumnStore):
+            row_size = sum([dtype.itemsize for dtype in self.data.dtypes])
+            return max(rows, len(self.data._columns[0])) * row_size
+
+        # a list slot, a tuple object and a float object per value
+        return rows * (sys.getsizeof(()) + 8 + n_columns * (8 + sys.getsizeof(0.0)))
+
+    def columns(self):
+        """Get the tracked data as columns, one array per variable.
+        The first column is the independent variable, followed by the
+        dependent variables in the order of the data labels.
+        For a columnar tracker these are zero-copy views of the stored data,
+        so they should not be kept across update() calls.
+
+        :return: A list of 1-D numpy arrays.
+        :rtype: list
+        """
+        self._merge_threads()
+
+        if isinstance(self.data, _ColumnStore):
+            return self.data.columns()
+
+        if not self.data:
+            return [np.empty(0) for _ in range(1 + len(self.dep_var_names))]
+        return [np.asarray(column) for column in zip(*self.data)]
 
     def save(self, _path=None):
         """Save data to an output file.
         If autosave is enabled, then default output file
         is removed.
+        The file is written atomically: the data is written to a temporary file, which
+        then replaces the output file, so a crash never leaves a partially written file.
 
         :param _path: Path to an output file. If not provided, a filename is a constructed
             out of the data labels.
         :type _path: str, optional
         """
+        self.flush()
+
+        # a bounded tracker only holds its most recent rows, the rest are in its output file
+        if isinstance(self.data, _RingStore):
+            self._save_bounded(_path)
+            return
 
         # determine output file path
         if not _path:
             _path = self.dir_path + '/' + _determine_tracker_filename(self, self.dir_path, '.csv')
 
         # write data to output file
-        with open(_path, 'w') as out_file:
-            content = ""
-            for line in self.data:
-                content += ','.join([str(v) for v in line]) + '\n'
-            out_file.write(content)
+        with _atomic_open(_path) as out_file:
+            if isinstance(self.data, _ColumnStore):
+                out_file.write(_csv_header(self.dtypes))
+                for columns in self.data.iter_chunks():  # chunk by chunk, to keep memory use bounded
+                    out_file.write(_format_csv_columns(columns))
+            else:
+                out_file.write(_format_csv_rows(self.data))
 
         # remove previous output file if existed
         if p := getattr(self, 'path', False):
+            self._writer.close()
             remove(p)
 
-    def _append_to_out_file(self, line):
-        """This is a helper to the autosave operation.
-        Appends a line to the output file located at self.path.
-        self.path is only declared if autosave is True.
-        If the file is currently denying permission (potentially
-        because the user opened it in another program), it warns the user,
-        blocks and waits until the operation succeeds.
+    def export_csv(self, _path=None):
+        """Export the tracker's binary output file (see autosave_format) as a .csv file.
+        The file is converted chunk by chunk, so this works for files of any size.
 
-        :param line: A line to append to the output file located at self.path.
-        :type line: str
+        :param _path: Path to the .csv file. By default, the binary file's path with a .csv ending.
+        :type _path: str, optional
+        :return: The path to the .csv file.
+        :rtype: str
         """
-        try:
-            with open(self.path, 'a') as out_file:
-                out_file.write(line + '\n')
-        except PermissionError:
-            warnings.warn("Tracker's output file is denying permission."
-                          "\nCheck if the file is currently open in another program."
-                          "\nThe program is currently blocked until permission "
-                          "is granted.")
-            # wait and then try again
-            time.sleep(1)
-            self._append_to_out_file(line)
+        if self.autosave_format != 'binary' or not getattr(self, 'path', False):
+            raise Exception("Only trackers with a binary output file can be exported.")
 
+        self.flush()
+        if not _path:
+            _path = path.splitext(self.path)[0] + '.csv'
 
-class Toggle:
-    """This class represents a toggle button.
-    It is supposed to be a helper to Monitor, with which
-    you can add toggles through the add_toggle() method.
-    But it can also work independently.
-    This class has two "modes":
-    Each object is either the main_toggle, which
-    means that it's in charge of opening the listening process which opens
-    the window of toggles. Or - it isn't the main toggle, and then it is joined
-    to a main_toggle. The main toggle's process accepts new toggles and adds them to
-    its tkinter window.
-    A 'toggle' is simply a button that can be pressed by the user as many times as they like.
-    Whenever the user presses the button, a count variable is incremented.
-    When the method `toggled()` is then invoked, True is returned if the count value
-    is not zero, and the count gets decremented. Thus, the method `toggled()` returns
-    True for every toggle made by the user.
-    Additionally, Toggle has a toggle_count member that keeps track of all toggles
-    made so far and "discovered" (i.e. `toggled()` returned True for them).
-    When closing a toggle, its button gets disabled but still appears as long as other toggles
-    are enabled. When all toggles joined in the same window are closed, then the window and listening
-    process are closed.
+        _export_binary_to_csv(self.path, _path)
+        return _path
 
-    :param main_toggle: A main toggle that's in charge of opening the listening process,
-        which then creates a window and accepts other toggles. If None, then this object
-        would be a main toggle itself.
-    :type main_toggle: Toggle, None
-    :param name: A name for the Toggle. The name appears on the button.
-    :type name: str, optional
-    :param desc: A description for the Toggle. The description appears above the button.
-    :type desc: str, optional
-    :param window_title: A title for the toggles window. This is relevant if this
-        toggle is the main_toggle, as it opens the process that opens the window.
-    :type window_title: str, optional
-    """
+    def _save_bounded(self, _path):
+        """Helper to save() for trackers created with max_points.
+        Rows that were evicted from memory have already been streamed to the output file
+        at self.path, so only the rows that haven't been written yet are appended to it.
+        If another path is provided, the complete output file is then copied there.
 
-    def __init__(self, main_toggle, name='Toggle', desc="Press to toggle", window_title="Toggle(s)"):
-        self.toggle_count = 0
+        :param _path: Path to an output file, or None to only complete the file at self.path.
+        :type _path: str, None
+        """
+        if not getattr(self, 'path', False):
+            raise Exception("A bounded tracker of a Monitor with no output directory cannot be saved.")
 
-        if not main_toggle:
-            self.main = True
+        if self.data.spill:
+            self._spill(self.data.take_unspilled())
+        self._writer.flush()
 
-            self.id = 0
-            self.counts = Manager().list()
-            self.counts.append(0)
+        if _path and path.abspath(_path) != path.abspath(self.path):
+            if self.autosave_format == 'binary' and not _path.endswith('.bin'):
+                _export_binary_to_csv(self.path, _path)
+            else:
+                with open(self.path, 'rb') as in_file, _atomic_open(_path, 'wb') as out_file:
+                    shutil.copyfileobj(in_file, out_file)
 
-            self.__in_q = Queue()
-            self.__process = Process(target=_toggle_window, args=(self.__in_q, self.counts, name, desc, window_title,))
-            self.__process.start()
+    def _spill(self, columns):
+        """Append rows evicted from a bounded tracker's memory to its output file.
 
+        :param columns: A list of columns of the rows, one 1-D array per data label.
+        :type columns: list
+        """
+        if len(columns[0]):
+            self._writer.write_columns(columns)
+
+    def _extend_data(self, columns):
+        """Append a block of rows to the data, given column by column.
+        This works for both list-based and columnar trackers.
+
+        :param columns: A sequence of equal-length 1-D arrays, one per data label.
+        :type columns: sequence
+        """
+        if isinstance(self.data, _ColumnStore):
+            self.data.extend(columns)
         else:
-            self.main = False
+            self.data.extend(zip(*[np.asarray(column).tolist() for column in columns]))
+
+
+class TrackerHandle:
+    """A picklable handle for updating a Tracker from another process.
+    Created by Tracker.handle(). The rows are buffered in the process that uses the handle,
+    and sent in batches to the process of the tracker (see _RemoteReceiver), over a connection
+    that's opened the first time a batch is sent from each process.
+
+    :param tracker_id: The ID of the tracker.
+    :type tracker_id: float
+    :param n_columns: The number of data labels of the tracker.
+    :type n_columns: int
+    :param address: The address of the receiver.
+    :type address: str, tuple
+    :param authkey: The authentication key of the receiver.
+    :type authkey: bytes
+    :param batch_size: The number of rows sent at once.
+    :type batch_size: int
+    """
 
-            self.id = len(main_toggle.counts)
-            self.counts = main_toggle.counts
-            self.counts.append(0)
+    def __init__(self, tracker_id, n_columns, address, authkey, batch_size):
+        self.tracker_id = tracker_id
+        self.n_columns = n_columns
+        self.address = address
+        self.authkey = authkey
+        self.batch_size = batch_size
+        self._init_buffer()
 
-            self.__in_q = main_toggle.__in_q
-            self._send(1)  # signal to add a toggle
-            self._send(name)
-            self._send(desc)
+    def __getstate__(self):
+        # the buffered rows stay in the process that recorded them
+        state = vars(self).copy()
+        del state['_buffer'], state['_finalizer']
+        return state
 
-    def toggled(self):
-        """Returns True for every toggle made by the user.
-        Each time a user presses the toggle, a count is incremented.
-        This method returns True if the count is bigger than 0, and decrements the count.
+    def __setstate__(self, state):
+        vars(self).update(state)
+        self._init_buffer()
 
-        :return: True if the button has been toggled. False if it hasn't.
-        :rtype: bool
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
+    def update(self, ind_var, *dep_vars):
+        """Same as Tracker.update(). The row is buffered, and sent when batch_size rows are buffered.
+
+        :param ind_var: A new value for the independent variable.
+        :type ind_var: float
+        :param dep_vars: New values for all dependent variables.
+        :type dep_vars: float
         """
-        if self.counts[self.id] > 0:
-            self.toggle_count += 1
-            self.counts[self.id] -= 1
-            return True
-        return False
+        if len(dep_vars) != self.n_columns - 1:
+            raise Exception(f"Amount of data values ({1 + len(dep_vars)}) is "
+                            f"different than the amount of data labels ({self.n_columns}).")
 
-    def close(self):
-        """Closes this toggle. If other toggles
-        in the window are still enabled, this toggle's button
-        will still appear but will become disabled. When all
-        toggles in the window are closed, then the window is closed as well.
+        self._buffer.append(ind_var)
+        self._buffer.extend(dep_vars)
+        if len(self._buffer) >= self.batch_size * self.n_columns:
+            self.flush()
 
+    def update_many(self, ind_vars, *dep_vars):
+        """Same as Tracker.update_many(). The block is sent right away (after the buffered rows),
+        and validated by the tracker.
+
+        :param ind_vars: Values of the independent variable, or a 2-D block of all values.
+        :type ind_vars: array-like
+        :param dep_vars: Values of all dependent variables, one array-like per variable.
+        :type dep_vars: array-like
         """
-        self._send(2)
-        self._send(self.id)
+        self.flush()
+        _send_remote(self.address, self.authkey, (self.tracker_id, [np.asarray(ind_vars), *map(np.asarray, dep_vars)]))
 
-    def _send(self, data):
-        """Used to send data to the listening process through
-        the instructions Queue.
+    def flush(self):
+        """Send the buffered rows.
+        """
+        _flush_remote_buffer(self._buffer, self.tracker_id, self.n_columns, self.address, self.authkey)
 
-        :param data: Any data to be sent to the process.
+    def _init_buffer(self):
+        """Create an empty buffer of rows (a flat list of values), which is flushed
+        when the handle is garbage collected.
         """
-        self.__in_q.put(data)
+        self._buffer = []
+        self._finalizer = weakref.finalize(self, _flush_remote_buffer, self._buffer, self.tracker_id,
+                                           self.n_columns, self.address, self.authkey)
 
 
-# -----------------
-# UTILITY FUNCTIONS
-# -----------------
-def _live_view_process(monitor: Monitor, data_q: Queue, update_rate):
-    """This is the live view process.
-    It creates and updates the live view figure.
-    This process receives a copy of the Monitor object, as well
-    as a Queue for communication and an update rate.
-    When started, the process still doesn't show anything. When a Tracker
-    in the MAIN process gets updated with new values (aka via tracker.update()),
-    it then sends the new values to this process through the Queue structure, along
-    with the Tracker's ID. Only then does the live view starts showing its updating plot.
-    This is done so that only currently-updating trackers are plotted in the live view.
-    If another tracker will later get updated as well, it will also be plotted and added to the
-    live view figure.
-    The live view only checks the Queue and updates the plots every
-    once in a while, according to the update_rate, and in the rest of the time - it sleeps.
-    This continues until the main process signals this process to stop. It does so
-    by putting None in the Queue.
+class _RemoteReceiver:
+    """Helper to Monitor.
+    Receives the rows that tracker handles (see Tracker.handle()) send from other processes,
+    and adds them to the trackers. It listens on a local address (a Unix socket or a named pipe),
+    and only accepts connections that authenticate with its random key. One thread accepts
+    new connections, and another one waits on all of them and receives the batches of rows.
 
-    :param monitor: A monitor clone object (pickled and un-pickled).
-    :type monitor: Monitor
-    :param data_q: A data queue for sending new values to the process.
-    :type data_q: multiprocessing.Queue
-    :param update_rate: How many updates to perform per second.
-    :type update_rate: float
     """
-    plt.ion()
-    backend = matplotlib.get_backend()
-    matplotlib.use('TkAgg')
-
-    figure = None
-    active = True
-
-    # create an id_to_tracker dictionary
-    id_to_tracker = dict()
-    for trackers in monitor.titled_trackers.values():
-        for tracker in trackers:
-            id_to_tracker[tracker._id] = tracker
-
-    trackers = []
-    id_to_axes = dict()
-
-    while active:
-        while not data_q.empty():
-            # get info from queue
-            if not (info := data_q.get_nowait()):  # if info is None, it's a signal to quit
-                active = False
-                break
 
-            _id, data = info
-            # check if id is known to the process, because
-            # it could be a new id that hasn't been sent to the process in advance
-            if _id in id_to_tracker:
+    def __init__(self):
+        from multiprocessing.connection import Listener
 
-                # update tracker data
-                id_to_tracker[_id].data.append(data)
+        self.authkey = urandom(32)
+        self._listener = Listener(authkey=self.authkey)
+        self.address = self._listener.address
+        self.trackers = {}  # tracker id -> Tracker
 
-                # if new tracker
-                if id_to_tracker[_id] not in trackers:
-                    # add tracker to trackers
-                    trackers.append(id_to_tracker[_id])
+        self._connections = []
+        self._closing = False  # set when the receiver is closed
+        self._accepted_all = False  # set when no more connections will be accepted
 
-                    # redraw figure
-                    figure, axs = _redraw_live_view(monitor, figure, trackers)
+        self._accepter = threading.Thread(target=self._accept, name='simmon-remote-accept', daemon=True)
+        self._receiver = threading.Thread(target=self._receive, name='simmon-remote-receive', daemon=True)
+        self._accepter.start()
+        self._receiver.start()
 
-                    # update id_to_axes
-                    for i in range(len(trackers)):
-                        id_to_axes[trackers[i]._id] = axs[i]
+    def close(self):
+        """Stop accepting connections, receive all rows that have already been sent, and close.
+        """
+        self._closing = True
 
-                # if an already existing tracker
-                else:
-                    # update the appropriate axes
-                    _update_live_view_axes(data, id_to_tracker[_id], id_to_axes[_id])
+        # wake the accepting thread. Connecting blocks if that thread is gone,
+        # so it's done in the background, and the thread is waited for a limited time
+        threading.Thread(target=self._wake_accepter, name='simmon-remote-wake', daemon=True).start()
+        self._accepter.join(timeout=5)
+        self._listener.close()
 
-        if figure:  # update figure
-            figure.canvas.draw()
-            figure.canvas.flush_events()
-            _custom_pause_live_view(10 ** -36)
+        self._accepted_all = True
+        self._receiver.join()
 
-        # wait for next update
-        time.sleep(1 / update_rate)
+    def _wake_accepter(self):
+        """Connect to the listener, so that the accepting thread returns from accept().
+        """
+        from multiprocessing import AuthenticationError
+        from multiprocessing.connection import Client
 
-    matplotlib.use(backend)
-    plt.ioff()
+        try:
+            Client(self.address, authkey=self.authkey).close()
+        except (OSError, EOFError, AuthenticationError):
+            pass
 
+    def _accept(self):
+        """The loop of the accepting thread.
+        """
+        from multiprocessing import AuthenticationError
 
-def _custom_pause_live_view(interval):
-    """This is a custom pause used for a proper update of
-    the live view figure. This is a solution taken from Stack Overflow.
+        while not self._closing:
+            try:
+                connection = self._listener.accept()
+            except (OSError, EOFError, AuthenticationError):  # including failed authentication
+                continue
+            self._connections.append(connection)
+
+    def _receive(self):
+        """The loop of the receiving thread. Once no more connections will be accepted,
+        it receives whatever has already been sent and stops.
+        """
+        from multiprocessing.connection import wait
+
+        while True:
+            draining = self._accepted_all
+            connections = list(self._connections)
+            ready = wait(connections, timeout=0.05) if connections else []
+            if not connections:
+                time.sleep(0.05)
+
+            for connection in ready:
+                try:
+                    tracker_id, columns = connection.recv()
+                except (EOFError, OSError):  # the other process has closed the connection
+                    self._connections.remove(connection)
+                    continue
+
+                try:
+                    self.trackers[tracker_id].update_many(*columns)
+                except Exception as e:
+                    warnings.warn(f"Rows received from a tracker handle have been dropped: {e!r}")
+
+            if draining and not ready:
+                break
 
-    :param interval: A pause interval.
-    :type interval: float
-    """
-    backend = plt.rcParams['backend']
-    if backend in matplotlib.rcsetup.interactive_bk:
-        fig_manager = matplotlib._pylab_helpers.Gcf.get_active()
-        if fig_manager is not None:
-            canvas = fig_manager.canvas
-            if canvas.figure.stale:
-                canvas.draw()
-            canvas.start_event_loop(interval)
-            return
+        for connection in self._connections:
+            connection.close()
 
 
-def _redraw_live_view(monitor, prev_figure, trackers):
-    """Helper to the live view process.
-    Whenever new trackers get updated, their plots
-    should be added to the live view figure (see _live_view_process). In this case, a new figure
-    needs to be created.
+# connections of this process to receivers (see TrackerHandle), by receiver address and process id
+_remote_connections = {}
+_remote_connections_lock = threading.Lock()
 
-    :param monitor: The monitor clone containing the tracker objects.
-    :type monitor: Monitor
-    :param prev_figure: The previous figure.
+
+def _send_remote(address, authkey, message):
+    """Helper to TrackerHandle.
+    Sends a message to a receiver, connecting to it if this process hasn't already.
+
+    :param address: The address of the receiver.
+    :type address: str, tuple
+    :param authkey: The authentication key of the receiver.
+    :type authkey: bytes
+    :param message: A (tracker id, list of columns) tuple.
+    :type message: tuple
+    """
+    key = (address, getpid())  # a forked process shouldn't use the connection of its parent
+    with _remote_connections_lock:
+        if key not in _remote_connections:
+            from multiprocessing.connection import Client
+            _remote_connections[key] = Client(address, authkey=authkey)
+        _remote_connections[key].send(message)
+
+
+def _flush_remote_buffer(buffer, tracker_id, n_columns, address, authkey):
+    """Helper to TrackerHandle.
+    Sends the rows in a handle's buffer as a block of columns, and empties the buffer.
+
+    :param buffer: A flat list of values, n_columns per row.
+    :type buffer: list
+    :param tracker_id: The ID of the tracker.
+    :type tracker_id: float
+    :param n_columns: The number of data labels of the tracker.
+    :type n_columns: int
+    :param address: The address of the receiver.
+    :type address: str, tuple
+    :param authkey: The authentication key of the receiver.
+    :type authkey: bytes
+    """
+    if not buffer:
+        return
+
+    columns = [np.asarray(buffer[i::n_columns]) for i in range(n_columns)]
+    buffer.clear()
+    _send_remote(address, authkey, (tracker_id, columns))
+
+
+class _Sampler:
+    """Sampling policy of a Tracker, which decides which updates are recorded.
+    An update is recorded only if it's accepted by all of the policies that are set:
+    - record_every: every record_every-th update is recorded, starting with the first one.
+    - min_interval: at most one update is recorded per min_interval seconds of wall-clock time.
+    - min_delta: an update is recorded if its independent variable differs by at least
+      min_delta from that of the last recorded update.
+
+    :param record_every: Record every record_every-th update.
+    :type record_every: int, optional
+    :param min_interval: Minimal wall-clock time between recorded updates, in seconds.
+    :type min_interval: float, optional
+    :param min_delta: Minimal change of the independent variable between recorded updates.
+    :type min_delta: float, optional
+    """
+
+    def __init__(self, record_every=None, min_interval=None, min_delta=None):
+        if record_every is not None and record_every < 1:
+            raise ValueError(f"record_every must be a positive integer, not {record_every}.")
+
+        self.record_every = record_every or 1
+        self.min_interval = min_interval
+        self.min_delta = min_delta
+        self._calls = 0
+        self._last_time = -np.inf
+        self._last_value = None
+
+    def accept(self, ind_var):
+        """Decide whether a single update should be recorded.
+
+        :param ind_var: The value of the independent variable of the update.
+        :type ind_var: float
+        :return: True if the update should be recorded.
+        :rtype: bool
+        """
+        calls = self._calls
+        self._calls = calls + 1
+        if calls % self.record_every:
+            return False
+
+        if self.min_interval:
+            now = time.monotonic()
+            if now - self._last_time < self.min_interval:
+                return False
+
+        if self.min_delta:
+            if self._last_value is not None and abs(ind_var - self._last_value) < self.min_delta:
+                return False
+            self._last_value = ind_var
+
+        if self.min_interval:
+            self._last_time = now
+        return True
+
+    def select(self, ind_vars):
+        """Decide which updates of a block should be recorded.
+
+        :param ind_vars: The values of the independent variable of the block.
+        :type ind_vars: numpy.ndarray
+        :return: A boolean mask of the updates to record.
+        :rtype: numpy.ndarray
+        """
+        mask = (np.arange(self._calls, self._calls + len(ind_vars)) % self.record_every) == 0
+        self._calls += len(ind_vars)
+
+        if self.min_interval:
+            # the whole block arrives at once, so only its first candidate can pass
+            now = time.monotonic()
+            candidates = np.flatnonzero(mask)
+            mask[:] = False
+            if len(candidates) and now - self._last_time >= self.min_interval:
+                mask[candidates[0]] = True
+
+        if self.min_delta:
+            # each decision depends on the last recorded value, so go over the candidates in order
+            for i in np.flatnonzero(mask):
+                value = ind_vars[i].item()
+                if self._last_value is not None and abs(value - self._last_value) < self.min_delta:
+                    mask[i] = False
+                else:
+                    self._last_value = value
+
+        if self.min_interval and mask.any():
+            self._last_time = now
+        return mask
+
+
+class _Compressor:
+    """Lossy compression of a Tracker's series. Rows are pushed one by one, and the
+    compressor returns the rows that should be stored. A row is stored if any of the dependent
+    variables needs it. Two modes are supported:
+    - 'deadband': a row is stored when any variable differs from its last stored value by
+      more than its tolerance. Reconstruct by holding the last stored value.
+    - 'swinging_door': the swinging door algorithm. Starting from the last stored row (the anchor),
+      each variable keeps a 'door' - the range of slopes of lines from the anchor that pass within
+      the tolerance of every row received since. While the line from the anchor to the newest row
+      stays inside the door of every variable, the rows in between are dropped. Otherwise, the
+      previous row is stored and becomes the new anchor. Reconstruct by linear interpolation.
+    In both modes the last row received is held back (it may not be needed), and flush() returns it.
+
+    :param mode: Either 'deadband' or 'swinging_door'.
+    :type mode: str
+    :param tolerance: The error bound, for all dependent variables or a sequence (or array) with one per variable.
+    :type tolerance: float, sequence, numpy.ndarray
+    :param n_dep_vars: The number of dependent variables.
+    :type n_dep_vars: int
+    """
+
+    def __init__(self, mode, tolerance, n_dep_vars):
+        if mode not in ('deadband', 'swinging_door'):
+            raise ValueError(f"Invalid compression '{mode}'! Use either 'deadband' or 'swinging_door'.")
+
+        if tolerance is None:
+            raise ValueError("A tolerance must be provided for compression.")
+
+        # a single tolerance, or any sequence / array with one per variable
+        tolerance = np.asarray(tolerance, dtype=float)
+        if np.ndim(tolerance) and tolerance.size != n_dep_vars:
+            raise ValueError(f"Amount of tolerances ({tolerance.size}) is "
+                             f"different than the amount of dependent variables ({n_dep_vars}).")
+        self.tolerances = np.broadcast_to(tolerance.ravel() if np.ndim(tolerance) else tolerance,
+                                          (n_dep_vars,)).tolist()
+
+        self.mode = mode
+        self._anchor = None  # the last stored row
+        self._held = None  # the last row received, if it wasn't stored
+        self._lower = self._upper = None  # the door of each variable (swinging door)
+
+    def push(self, row):
+        """Push a new row.
+
+        :param row: A row of values, the independent variable first.
+        :type row: tuple
+        :return: The rows to store (usually none or one).
+        :rtype: list
+        """
+        if self._anchor is None:
+            self._store(row)
+            return [row]
+
+        if self.mode == 'deadband':
+            for value, stored, tolerance in zip(row[1:], self._anchor[1:], self.tolerances):
+                if abs(value - stored) > tolerance:
+                    self._store(row)
+                    return [row]
+            self._held = row
+            return []
+
+        if self._narrow_doors(row):
+            self._held = row
+            return []
+
+        # the row can't be reached from the anchor, so store the held row and start over from it
+        stored = []
+        if self._held is not None:
+            stored.append(self._held)
+            self._store(self._held)
+            if self._narrow_doors(row):
+                self._held = row
+                return stored
+
+        # the row can't be reached from the new anchor either (it doesn't come after it)
+        stored.append(row)
+        self._store(row)
+        return stored
+
+    def flush(self):
+        """Store the held row, if there is one.
+
+        :return: The held row, or None.
+        :rtype: tuple, None
+        """
+        row = self._held
+        if row is not None:
+            self._store(row)
+        return row
+
+    def _store(self, row):
+        """Make a row the new anchor, and reopen the doors.
+
+        :param row: The stored row.
+        :type row: tuple
+        """
+        self._anchor = row
+        self._held = None
+        self._lower = [-np.inf] * len(self.tolerances)
+        self._upper = [np.inf] * len(self.tolerances)
+
+    def _narrow_doors(self, row):
+        """If the line from the anchor to a row passes within the tolerance of all rows
+        received since the anchor, narrow the doors to pass within the tolerance of this row too.
+
+        :param row: A new row.
+        :type row: tuple
+        :return: False if the row can't be reached from the anchor (the doors are then left untouched).
+        :rtype: bool
+        """
+        dx = row[0] - self._anchor[0]
+        if dx <= 0:
+            return False
+
+        lower, upper = [], []
+        for i, (value, anchor, tolerance) in enumerate(zip(row[1:], self._anchor[1:], self.tolerances)):
+            slope = (value - anchor) / dx
+            if not self._lower[i] <= slope <= self._upper[i]:
+                return False
+            lower.append(max(self._lower[i], slope - tolerance / dx))
+            upper.append(min(self._upper[i], slope + tolerance / dx))
+
+        self._lower, self._upper = lower, upper
+        return True
+
+
+class _AutosaveWriter:
+    """A buffered writer that appends rows to a tracker's output file.
+    The file is kept open (it's opened on the first write), and appended content is
+    collected in a buffer, which is written to the file when it holds flush_every rows,
+    when flush_interval seconds have passed since the last write (checked whenever content
+    is appended, or regularly by the writer thread), and on flush() or close().
+    If a writer thread is given (see _AutosaveThread), the rows are handed to it, and it
+    formats and writes them. Otherwise, they're formatted and written right away.
+    If the file is denying permission (potentially because the user opened it in another
+    program), the user is warned, and the content is appended to a spool file next to it
+    (the output file's path + '.spool') instead, or kept in the buffer if the spool file can't
+    be written either. A background thread then merges the spool file into the output file
+    once it's writable (see _merge_spool()), so the updating thread never waits for it.
+
+    :param _path: Path to the output file.
+    :type _path: str
+    :param flush_every: The number of buffered rows that triggers a write. Default is 1000.
+    :type flush_every: int, optional
+    :param flush_interval: The maximal time in seconds between writes, or None for no limit.
+        Default is 1.0.
+    :type flush_interval: float, optional
+    :param thread: A writer thread to hand the rows to. Default is None.
+    :type thread: _AutosaveThread, optional
+    :param record_dtype: If provided, the rows are written as binary records of this
+        structured data type (see _binary_record_dtype()), instead of .csv lines.
+    :type record_dtype: numpy.dtype, optional
+    :param durability: What writing the buffer guarantees: 'none' only writes it to the file object,
+        which writes it to the operating system whenever its own buffer fills up. 'flush' also flushes
+        the file object, so the rows survive a crash of the program. 'fsync' also calls fsync()
+        every fsync_every rows (and on close()), so the rows survive a crash of the operating system
+        or a power loss. Default is 'flush'.
+    :type durability: str, optional
+    :param fsync_every: With durability='fsync', the number of rows between the fsync() calls.
+        The buffer is then written at least every fsync_every rows. Default is 1000.
+    :type fsync_every: int, optional
+    """
+
+    def __init__(self, _path, flush_every=1000, flush_interval=1.0, thread=None, record_dtype=None,
+                 durability='flush', fsync_every=1000):
+        if flush_every < 1:
+            raise ValueError(f"flush_every must be a positive integer, not {flush_every}.")
+
+        if durability not in ('none', 'flush', 'fsync'):
+            raise ValueError(f"Invalid durability '{durability}'! Use either 'none', 'flush' or 'fsync'.")
+
+        if durability == 'fsync':
+            if fsync_every < 1:
+                raise ValueError(f"fsync_every must be a positive integer, not {fsync_every}.")
+            flush_every = min(flush_every, fsync_every)
+
+        self.durability = durability
+        self.fsync_every = fsync_every
+        self._unsynced = 0  # the number of rows written since the last fsync()
+
+        self.path = _path
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._file = None
+        self._buffer = []
+        self._pending = 0  # the number of rows in the buffer
+        self._last_flush = time.monotonic()
+        # held while the buffer is written, since the spool file is shared with the merging thread
+        # (see _merge_spool_later()), and the buffer with the writer thread, which holds it while writing
+        self._lock = threading.RLock()
+        self._spool_path = None  # set while the output file is denying permission
+
+        self.record_dtype = record_dtype
+        self._binary = record_dtype is not None
+        if self._binary:
+            self._struct = _binary_struct(record_dtype)
+
+        self.thread = thread
+        if thread:
+            thread.register(self)
+
+    def write_rows(self, rows):
+        """Append rows to the output file.
+
+        :param rows: A list of rows, each a sequence of values.
+        :type rows: list
+        """
+        if self.thread:
+            self.thread.put(self, ('rows', rows, len(rows)))
+        else:
+            self._write(self.format_rows(rows), len(rows))
+
+    def write_columns(self, columns):
+        """Append a block of rows, given column by column, to the output file.
+
+        :param columns: Equal-length 1-D numpy arrays, one per data label.
+        :type columns: list
+        """
+        if self.thread:
+            # the columns might be views of arrays that change before they're written
+            self.thread.put(self, ('columns', [np.array(column) for column in columns], len(columns[0])))
+        else:
+            self._write(self.format_columns(columns), len(columns[0]))
+
+    def format_rows(self, rows):
+        """Format rows as content of the output file.
+
+        :param rows: A list of rows, each a sequence of values.
+        :type rows: list
+        :return: .csv lines, or binary records.
+        :rtype: str, bytes
+        """
+        if not self._binary:
+            return _format_csv_rows(rows)
+
+        if self._struct:
+            pack = self._struct.pack
+            return b''.join([pack(*row) for row in rows])
+        return np.array([tuple(row) for row in rows], dtype=self.record_dtype).tobytes()
+
+    def format_columns(self, columns):
+        """Format a block of rows, given column by column, as content of the output file.
+
+        :param columns: Equal-length 1-D numpy arrays, one per data label.
+        :type columns: list
+        :return: .csv lines, or binary records.
+        :rtype: str, bytes
+        """
+        if not self._binary:
+            return _format_csv_columns(columns)
+
+        records = np.empty(len(columns[0]), dtype=self.record_dtype)
+        for name, column in zip(self.record_dtype.names, columns):
+            records[name] = column
+        return records.tobytes()
+
+    def _write(self, content, n_rows):
+        """Append content to the buffer, and write the buffer if it's due.
+
+        :param content: One or more newline-terminated lines.
+        :type content: str
+        :param n_rows: The number of lines in content.
+        :type n_rows: int
+        """
+        self._buffer.append(content)
+        self._pending += n_rows
+
+        if self._pending >= self.flush_every or self._flush_due():
+            with self._lock:
+                self._flush_buffer()
+
+    def _flush_due(self):
+        return self.flush_interval is not None and time.monotonic() - self._last_flush >= self.flush_interval
+
+    def flush(self):
+        """Write the buffer to the output file, after the writer thread
+        has written everything handed to it.
+        """
+        if self.thread:
+            self.thread.drain()
+
+        with self._lock:
+            self._flush_buffer()
+
+    def _flush_buffer(self):
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+
+        content = (b'' if self._binary else '').join(self._buffer)
+        mode = 'ab' if self._binary else 'a'
+        if self._spool_path is None:
+            try:
+                if self._file is None:
+                    self._file = open(self.path, mode)
+                self._file.write(content)
+
+                if self.durability != 'none':
+                    self._file.flush()
+
+                if self.durability == 'fsync':
+                    self._unsynced += self._pending
+                    if self._unsynced >= self.fsync_every:
+                        fsync(self._file.fileno())
+                        self._unsynced = 0
+            except PermissionError:
+                self._close_file()
+                self._start_spooling()
+
+        # while the output file is denying permission, content goes to the spool file
+        if self._spool_path is not None:
+            try:
+                with open(self._spool_path, mode) as spool:
+                    spool.write(content)
+            except PermissionError:
+                self._buffer = [content]  # keep it until one of the files is writable
+                return
+
+        self._buffer = []
+        self._pending = 0
+
+    def _start_spooling(self):
+        """Append content to the spool file from now on, and start a thread
+        that merges it into the output file once it's writable.
+        """
+        self._spool_path = self.path + '.spool'
+        warnings.warn(f"Tracker's output file is denying permission."
+                      f"\nCheck if the file is currently open in another program."
+                      f"\nUntil permission is granted, rows are kept in {self._spool_path}.")
+
+        threading.Thread(target=self._merge_spool_later, name='simmon-spool', daemon=True).start()
+
+    def _merge_spool_later(self):
+        """Try to merge the spool file into the output file every SPOOL_RETRY_INTERVAL seconds,
+        until it succeeds.
+        """
+        while True:
+            time.sleep(SPOOL_RETRY_INTERVAL)
+            with self._lock:
+                if self._spool_path is None or _merge_spool(self.path):
+                    self._spool_path = None
+                    return
+
+    def close(self):
+        """Write the buffer and close the output file. The file is reopened
+        if more content is written.
+        """
+        self.flush()
+        with self._lock:
+            self._close_file()
+
+            if self._spool_path is not None:
+                if _merge_spool(self.path):
+                    self._spool_path = None
+                else:
+                    warnings.warn(f"Tracker's output file is still denying permission. Its last rows are kept "
+                                  f"in {self._spool_path}, and added to it when it's loaded by load_from_dir().")
+
+    def _close_file(self):
+        if self._file is not None:
+            if self.durability == 'fsync' and self._unsynced:
+                self._file.flush()
+                fsync(self._file.fileno())
+                self._unsynced = 0
+
+            self._file.close()
+            self._file = None
+
+
+class _AutosaveThread:
+    """A writer thread that formats and writes the autosaved rows of all trackers of a Monitor.
+    Writers (see _AutosaveWriter) put batches of rows in a bounded queue, and the thread writes
+    them in order. When the queue is full, the backpressure policy decides what happens:
+    - 'block': the updating thread waits until there's room in the queue.
+    - 'coalesce': the batch is merged into the last queued batch of the same writer, so the number
+      of queued batches doesn't grow (if the writer has no queued batch, it's queued anyway).
+    - 'spill': the batch is pickled into a temporary spill file, and so are all following batches,
+      until the thread has written all the queued and spilled batches.
+    When the queue is empty, the thread writes the buffers of writers whose flush_interval has passed.
+    An error raised while writing (e.g. a value that can't be formatted, or a full disk) is kept, and
+    raised by the next put(), drain() or close(). If the thread stops, the batches are written by the
+    calling thread instead, so nothing waits for it.
+
+    :param max_size: The number of batches the queue holds. Default is 1000.
+    :type max_size: int, optional
+    :param backpressure: The backpressure policy, 'block', 'coalesce' or 'spill'. Default is 'block'.
+    :type backpressure: str, optional
+    """
+
+    def __init__(self, max_size=1000, backpressure='block'):
+        if backpressure not in ('block', 'coalesce', 'spill'):
+            raise ValueError(f"Invalid backpressure '{backpressure}'! "
+                             f"Use either 'block', 'coalesce' or 'spill'.")
+        if max_size < 1:
+            raise ValueError(f"The autosave queue size must be a positive integer, not {max_size}.")
+
+        self.max_size = max_size
+        self.backpressure = backpressure
+        self.writers = []  # all registered writers, by index (spilled batches refer to their writers by index)
+
+        # each queued batch is a list of [writer, payloads, number of rows, time queued],
+        # where a payload is a ('rows' or 'columns', data, number of rows) tuple
+        self._queue = deque()
+        self._condition = threading.Condition(threading.Lock())
+        self._spill_file = None
+        self._spill_position = 0  # where the next spilled batch is read from
+        self._spill_times = deque()  # the times the spilled batches were queued
+        self._writing = None  # the time the oldest batch being written was queued
+        self._idle = False  # whether the thread waits for batches
+        self._closed = False
+        self._stopped = False  # set if the thread stops because of an error
+        self._error = None  # the first error raised while writing, until it's raised again
+
+        # metrics
+        self._max_depth = 0
+        self._rows_written = 0
+        self._blocked_seconds = 0.0
+        self._coalesced = 0
+        self._spilled = 0
+
+        self._thread = threading.Thread(target=self._run, name='simmon-autosave', daemon=True)
+        self._thread.start()
+
+    def register(self, writer):
+        """Register a writer, so that its batches can be spilled.
+
+        :param writer: A writer that puts batches in this thread's queue.
+        :type writer: _AutosaveWriter
+        """
+        writer.index = len(self.writers)
+        self.writers.append(writer)
+
+    def put(self, writer, payload):
+        """Queue a batch of rows, applying the backpressure policy if the queue is full.
+
+        :param writer: The writer of the batch.
+        :type writer: _AutosaveWriter
+        :param payload: A ('rows' or 'columns', data, number of rows) tuple.
+        :type payload: tuple
+        """
+        with self._condition:
+            now = time.monotonic()
+            full = len(self._queue) >= self.max_size
+
+            # once spilling, keep spilling until the spill file is written, so that batches stay in order
+            if self._spill_times or (full and self.backpressure == 'spill'):
+                self._spill(writer, payload, now)
+
+            elif not (full and self.backpressure == 'coalesce' and self._coalesce(writer, payload)):
+                if full and self.backpressure == 'block':
+                    while len(self._queue) >= self.max_size and self._running():
+                        self._condition.wait(0.1)
+                    self._blocked_seconds += time.monotonic() - now
+
+                self._queue.append([writer, [payload], payload[2], now])
+                if len(self._queue) > self._max_depth:
+                    self._max_depth = len(self._queue)
+
+            if self._idle:
+                self._condition.notify_all()
+
+        if not self._running():
+            self._write_remaining()
+        self._raise_error()
+
+    def _coalesce(self, writer, payload):
+        """Merge a batch into the last queued batch of the same writer.
+
+        :return: Whether the batch was merged.
+        :rtype: bool
+        """
+        for batch in reversed(self._queue):
+            if batch[0] is writer:
+                batch[1].append(payload)
+                batch[2] += payload[2]
+                self._coalesced += 1
+                return True
+        return False
+
+    def _spill(self, writer, payload, now):
+        """Append a batch to the spill file.
+        """
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile()
+
+        self._spill_file.seek(0, 2)
+        pickle.dump((writer.index, payload), self._spill_file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._spill_times.append(now)
+        self._spilled += 1
+
+    def _unspill(self):
+        """Read the oldest batch from the spill file.
+
+        :return: A queued batch.
+        :rtype: list
+        """
+        self._spill_file.seek(self._spill_position)
+        index, payload = pickle.load(self._spill_file)
+        self._spill_position = self._spill_file.tell()
+
+        queued = self._spill_times.popleft()
+        if not self._spill_times:  # all spilled batches have been read
+            self._spill_file.truncate(0)
+            self._spill_position = 0
+
+        return [self.writers[index], [payload], payload[2], queued]
+
+    def _running(self):
+        return not self._stopped and self._thread.is_alive()
+
+    def _record_error(self, error):
+        with self._condition:
+            if self._error is None:
+                self._error = error
+
+    def _raise_error(self):
+        """Raise the error kept by the thread, if any.
+        """
+        with self._condition:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _run(self):
+        """The writer thread. If it stops because of an error, the error is kept,
+        and the batches are written by the calling threads (see _write_remaining()).
+        """
+        try:
+            self._loop()
+        except Exception as error:
+            self._record_error(error)
+            with self._condition:
+                self._stopped = True
+                self._writing = None
+                self._condition.notify_all()
+
+    def _loop(self):
+        """The loop of the writer thread. It takes all the queued batches at once (or, if none
+        are queued, up to max_size spilled batches) and writes them.
+        """
+        while True:
+            with self._condition:
+                if not self._queue and not self._spill_times and not self._closed:
+                    self._idle = True
+                    self._condition.wait(0.1)
+                    self._idle = False
+
+                if self._queue:
+                    batches = list(self._queue)
+                    self._queue.clear()
+                elif self._spill_times:
+                    batches = [self._unspill() for _ in range(min(self.max_size, len(self._spill_times)))]
+                elif self._closed:
+                    return
+                else:
+                    batches = None
+
+                if batches:
+                    self._writing = batches[0][3]
+                    self._condition.notify_all()  # there's room in the queue
+
+            if not batches:  # idle, so write the buffers that are due
+                for writer in list(self.writers):
+                    try:
+                        with writer._lock:
+                            if writer._buffer and writer._flush_due():
+                                writer._flush_buffer()
+                    except Exception as error:
+                        self._record_error(error)
+                continue
+
+            self._write_batches(batches)
+
+            with self._condition:
+                self._writing = None
+                self._rows_written += sum([batch[2] for batch in batches])
+                self._condition.notify_all()
+
+    def _write_batches(self, batches):
+        """Format and write batches. The batches of each writer are written in order,
+        and consecutive rows of a writer are formatted together.
+        An error of a writer is kept (see _raise_error()), and the other writers are still written.
+
+        :param batches: A list of queued batches.
+        :type batches: list
+        """
+        payloads = {}
+        for writer, writer_payloads, _, _ in batches:
+            payloads.setdefault(writer, []).extend(writer_payloads)
+
+        for writer, writer_payloads in payloads.items():
+            try:
+                with writer._lock:
+                    rows = []
+                    for kind, data, n_rows in writer_payloads:
+                        if kind == 'rows':
+                            rows.extend(data)
+                            continue
+
+                        if rows:
+                            writer._write(writer.format_rows(rows), len(rows))
+                            rows = []
+                        writer._write(writer.format_columns(data), n_rows)
+
+                    if rows:
+                        writer._write(writer.format_rows(rows), len(rows))
+            except Exception as error:
+                self._record_error(error)
+
+    def _write_remaining(self):
+        """Write the queued and spilled batches in the calling thread, after the writer thread has stopped.
+        """
+        with self._condition:
+            batches = list(self._queue)
+            self._queue.clear()
+            while self._spill_times:
+                batches.append(self._unspill())
+
+        if batches:
+            self._write_batches(batches)
+            with self._condition:
+                self._rows_written += sum([batch[2] for batch in batches])
+
+    def drain(self):
+        """Wait until all queued and spilled batches are written to their writers,
+        and raise the error kept by the thread, if any.
+        """
+        with self._condition:
+            while (self._queue or self._spill_times or self._writing is not None) and self._running():
+                self._condition.wait(0.1)
+
+        if not self._running():
+            self._write_remaining()
+        self._raise_error()
+
+    def close(self):
+        """Write all batches and stop the thread. Its writers then write their rows right away.
+        The error kept by the thread, if any, is raised once the thread is stopped.
+        """
+        try:
+            self.drain()
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            self._thread.join()
+
+            for writer in self.writers:
+                writer.thread = None
+
+            if self._spill_file:
+                self._spill_file.close()
+
+    def metrics(self):
+        """Get the metrics of the thread (see Monitor.autosave_metrics()).
+
+        :return: A dictionary of metrics.
+        :rtype: dict
+        """
+        with self._condition:
+            # the oldest batch that hasn't been written is either being written, first in the queue or spilled
+            if self._writing is not None:
+                oldest = self._writing
+            elif self._queue:
+                oldest = self._queue[0][3]
+            elif self._spill_times:
+                oldest = self._spill_times[0]
+            else:
+                oldest = None
+
+            return {
+                'queue_depth': len(self._queue) + len(self._spill_times),
+                'max_queue_depth': self._max_depth,
+                'lag': time.monotonic() - oldest if oldest is not None else 0.0,
+                'rows_written': self._rows_written,
+                'blocked_seconds': self._blocked_seconds,
+                'coalesced_batches': self._coalesced,
+                'spilled_batches': self._spilled,
+            }
+
+
+class _ColumnStore:
+    """Columnar storage for Tracker data.
+    Instead of keeping a list of tuples, one growable numpy array is kept
+    per variable. Whenever the arrays run out of room, their capacity is doubled,
+    so appending is amortized O(1) and the values are stored as plain machine numbers
+    instead of Python objects.
+    The class mimics the parts of the list interface used by Tracker and the live view
+    (append(), len(), indexing and iteration over row tuples), and adds columns(),
+    which returns zero-copy views of the filled part of the arrays.
+
+    :param n_columns: The number of variables (independent variable included).
+    :type n_columns: int
+    :param capacity: The initial number of rows to allocate room for.
+    :type capacity: int, optional
+    :param dtypes: A numpy data type for each column. Default is float64 for all columns.
+    :type dtypes: list, optional
+    """
+
+    def __init__(self, n_columns, capacity=16, dtypes=None):
+        dtypes = dtypes or [np.float64] * n_columns
+        self._columns = [np.empty(max(capacity, 1), dtype=dtype) for dtype in dtypes]
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(zip(*[column[index].tolist() for column in self.columns()]))
+        # python values, like the rows returned by __iter__() and by slices
+        return tuple(column[index].item() for column in self.columns())
+
+    def __iter__(self):
+        return zip(*[column.tolist() for column in self.columns()])
+
+    def __getstate__(self):
+        # only pickle the filled part of the arrays (e.g. when sent to the live view process)
+        return {'_columns': [column.copy() for column in self.columns()], '_size': self._size}
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Create a store that holds the given columns.
+
+        :param columns: A sequence of equal-length 1-D arrays.
+        :type columns: sequence
+        :return: A new store.
+        :rtype: _ColumnStore
+        """
+        store = cls(len(columns), capacity=len(columns[0]), dtypes=[column.dtype for column in columns])
+        store.extend(columns)
+        return store
+
+    def append(self, row):
+        """Append a single row of values, one per column.
+
+        :param row: A sequence of values, ordered like the columns.
+        :type row: sequence
+        """
+        if self._size == len(self._columns[0]):
+            self._reserve(max(2 * self._size, 16))
+
+        for column, value in zip(self._columns, row):
+            column[self._size] = value
+        self._size += 1
+
+    def extend(self, columns):
+        """Append a block of rows, given column by column.
+
+        :param columns: A sequence of equal-length 1-D arrays, ordered like the columns.
+        :type columns: sequence
+        """
+        n_rows = len(columns[0])
+        end = self._size + n_rows
+        if end > len(self._columns[0]):
+            self._reserve(max(end, 2 * self._size))
+
+        for column, values in zip(self._columns, columns):
+            column[self._size:end] = values
+        self._size = end
+
+    @property
+    def dtypes(self):
+        """The numpy data types of the columns."""
+        return [column.dtype for column in self._columns]
+
+    def columns(self):
+        """Get views of the filled part of each column.
+
+        :return: A list of 1-D numpy arrays.
+        :rtype: list
+        """
+        return [column[:self._size] for column in self._columns]
+
+    def iter_chunks(self):
+        """Iterate over the data in consecutive blocks of rows.
+        Here the data is a single block, but stores that keep their data in parts
+        (see _ChunkedStore) yield one block at a time.
+
+        :return: An iterator of lists of 1-D numpy arrays, one per column.
+        :rtype: iterator
+        """
+        yield self.columns()
+
+    def _reserve(self, capacity):
+        """Grow the arrays so that they have room for at least capacity rows.
+
+        :param capacity: The number of rows to make room for.
+        :type capacity: int
+        """
+        if capacity <= len(self._columns[0]):
+            return
+
+        for i in range(len(self._columns)):
+            column = np.empty(capacity, dtype=self._columns[i].dtype)
+            column[:self._size] = self._columns[i][:self._size]
+            self._columns[i] = column
+
+
+class _RingStore(_ColumnStore):
+    """Bounded columnar storage for Tracker data.
+    Only the most recent max_points rows are kept in memory. Older rows are
+    evicted, and if a spill function is provided, they are handed to it before
+    they are lost (Tracker uses this to stream them to its output file).
+    To keep columns() zero-copy, each column has room for 2 * max_points rows and
+    the window of recent rows slides along it. When the window reaches the end of
+    the arrays, it is moved back to their start, which happens at most once every
+    max_points appends.
+    Rows are not spilled one by one: when an evicted row hasn't been spilled yet,
+    all the rows in the window that haven't been spilled are handed over together.
+    Rows that are still in memory and haven't been spilled can also be taken
+    with take_unspilled() (see Tracker.save()).
+
+    :param n_columns: The number of variables (independent variable included).
+    :type n_columns: int
+    :param max_points: The maximal number of rows to keep in memory.
+    :type max_points: int
+    :param spill: A function that receives a list of columns of rows that are
+        about to be evicted. If None, evicted rows are simply dropped.
+    :type spill: callable, optional
+    :param dtypes: A numpy data type for each column. Default is float64 for all columns.
+    :type dtypes: list, optional
+    """
+
+    def __init__(self, n_columns, max_points, spill=None, dtypes=None):
+        if max_points < 1:
+            raise ValueError(f"max_points must be a positive integer, not {max_points}.")
+
+        super().__init__(n_columns, capacity=2 * max_points, dtypes=dtypes)
+        self.max_points = max_points
+        self.spill = spill
+        self._start = 0
+        self._unspilled = 0  # number of rows at the end of the window that haven't been spilled
+
+    def __getstate__(self):
+        # the spill function stays with the original store (e.g. when sent to the live view process)
+        return {'_columns': [column.copy() for column in self.columns()], '_size': self._size,
+                'max_points': self.max_points}
+
+    def __setstate__(self, state):
+        self.__init__(len(state['_columns']), state['max_points'],
+                      dtypes=[column.dtype for column in state['_columns']])
+        self.extend(state['_columns'])
+
+    def append(self, row):
+        """Append a single row of values, one per column.
+        If the store is full, the oldest row is evicted.
+
+        :param row: A sequence of values, ordered like the columns.
+        :type row: sequence
+        """
+        if self._size == self.max_points:
+            self._evict(1)
+
+        end = self._start + self._size
+        if end == len(self._columns[0]):
+            self._slide_to_start()
+            end = self._size
+
+        for column, value in zip(self._columns, row):
+            column[end] = value
+        self._size += 1
+        if self.spill:
+            self._unspilled += 1
+
+    def extend(self, columns):
+        """Append a block of rows, given column by column.
+        If the store overflows, the oldest rows are evicted.
+
+        :param columns: A sequence of equal-length 1-D arrays, ordered like the columns.
+        :type columns: sequence
+        """
+        n_rows = len(columns[0])
+
+        # rows of the block that don't fit in memory at all are spilled directly
+        if n_rows > self.max_points:
+            self._evict(self._size)
+            if self.spill:
+                self.spill([values[:n_rows - self.max_points] for values in columns])
+            columns = [values[n_rows - self.max_points:] for values in columns]
+            n_rows = self.max_points
+
+        if self._size + n_rows > self.max_points:
+            self._evict(self._size + n_rows - self.max_points)
+
+        if self._start + self._size + n_rows > len(self._columns[0]):
+            self._slide_to_start()
+
+        end = self._start + self._size
+        for column, values in zip(self._columns, columns):
+            column[end:end + n_rows] = values
+        self._size += n_rows
+        if self.spill:
+            self._unspilled += n_rows
+
+    def columns(self):
+        """Get views of the rows currently kept in memory, one per column.
+
+        :return: A list of 1-D numpy arrays.
+        :rtype: list
+        """
+        return [column[self._start:self._start + self._size] for column in self._columns]
+
+    def take_unspilled(self):
+        """Get the rows kept in memory that haven't been spilled yet,
+        and consider them spilled from now on.
+
+        :return: A list of 1-D numpy arrays, one per column.
+        :rtype: list
+        """
+        columns = [column[self._size - self._unspilled:] for column in self.columns()]
+        self._unspilled = 0
+        return columns
+
+    def _evict(self, n_rows):
+        """Remove the oldest rows from memory, spilling them first if they haven't been spilled.
+
+        :param n_rows: The number of rows to remove.
+        :type n_rows: int
+        """
+        if n_rows > self._size - self._unspilled:
+            self.spill(self.take_unspilled())
+
+        self._start += n_rows
+        self._size -= n_rows
+
+    def _slide_to_start(self):
+        """Move the window of rows kept in memory to the start of the arrays.
+        """
+        for column in self._columns:
+            column[:self._size] = column[self._start:self._start + self._size]
+        self._start = 0
+
+
+class _MemmapStore(_ColumnStore):
+    """Columnar storage for Tracker data, backed by a memory-mapped file.
+    The rows are stored as fixed-width little-endian records in a .mmap file, and the
+    columns are zero-copy (strided) views of the mapped records. This way the operating
+    system's page cache decides which parts of the data are kept in RAM, and the data
+    stays on disk if the process crashes.
+    The file starts with a header: an 8-byte magic string, the number of rows (uint64),
+    the size of the header (uint32) and the comma-separated data type names, padded with
+    spaces to a multiple of 64 bytes. The number of rows is updated after each append,
+    so that a reopened file never includes a partially written row.
+    When the file runs out of room, it is extended to twice its capacity and mapped again.
+    Copies of this store (e.g. sent to the live view process) are plain _ColumnStores.
+
+    :param _path: Path to the .mmap file. If n_columns is None, an existing file is reopened.
+        Otherwise, a new file is created.
+    :type _path: str
+    :param n_columns: The number of variables (independent variable included).
+    :type n_columns: int, optional
+    :param capacity: The initial number of rows to make room for in a new file.
+    :type capacity: int, optional
+    :param dtypes: A numpy data type for each column. Default is float64 for all columns.
+    :type dtypes: list, optional
+    """
+
+    _MAGIC = b'SIMMON\x00\x01'
+
+    def __init__(self, _path, n_columns=None, capacity=1024, dtypes=None):
+        self.path = _path
+
+        if n_columns is None:  # reopen an existing file
+            with open(_path, 'rb') as file:
+                magic, size, self._header_size = struct.unpack('<8sQI', file.read(20))
+                if magic != self._MAGIC:
+                    raise ValueError(f"'{_path}' is not a tracker's memory-mapped data file.")
+                dtypes = [np.dtype(name) for name in file.read(self._header_size - 20).decode().split()[0].split(',')]
+
+            self._record_dtype = np.dtype([(f'f{i}', dtype.newbyteorder('<')) for i, dtype in enumerate(dtypes)])
+            capacity = (path.getsize(_path) - self._header_size) // self._record_dtype.itemsize
+            self._map(max(capacity, 1))
+            self._size = min(size, capacity)
+
+        else:  # create a new file
+            dtypes = [np.dtype(dtype) for dtype in dtypes or [np.float64] * n_columns]
+            names = ','.join([dtype.name for dtype in dtypes]).encode()
+            self._header_size = -(-(20 + len(names)) // 64) * 64  # round up to a multiple of 64
+            self._record_dtype = np.dtype([(f'f{i}', dtype.newbyteorder('<')) for i, dtype in enumerate(dtypes)])
+            with open(_path, 'wb') as file:
+                file.write(struct.pack('<8sQI', self._MAGIC, 0, self._header_size))
+                file.write(names.ljust(self._header_size - 20))
+
+            self._map(max(capacity, 1))
+            self._size = 0
+
+        self._count = np.memmap(_path, dtype='<u8', mode='r+', offset=8, shape=(1,))
+
+    def __reduce__(self):
+        return _ColumnStore.from_columns, ([column.copy() for column in self.columns()],)
+
+    def append(self, row):
+        super().append(row)
+        self._count[0] = self._size
+
+    def extend(self, columns):
+        super().extend(columns)
+        self._count[0] = self._size
+
+    def flush(self):
+        """Write any changes of the mapped data to the file on disk.
+        """
+        self._records.flush()
+        self._count.flush()
+
+    def _map(self, capacity):
+        """Map the file's records, extending the file if it's smaller than capacity rows.
+
+        :param capacity: The number of rows to map.
+        :type capacity: int
+        """
+        self._records = np.memmap(self.path, dtype=self._record_dtype, mode='r+',
+                                  offset=self._header_size, shape=(capacity,))
+        self._columns = [self._records[name].view(np.ndarray) for name in self._record_dtype.names]
+
+    def _reserve(self, capacity):
+        if capacity <= len(self._records):
+            return
+
+        self._records.flush()
+        self._map(capacity)
+
+
+class _ChunkPool:
+    """Shares a memory budget between the chunks of the _ChunkedStores of a Monitor.
+    The pool keeps the chunks that are currently in memory ordered from the least
+    recently used to the most recently used. Whenever a chunk is allocated or loaded back
+    into memory and the budget is exceeded, the least recently used chunks are spilled
+    to binary files in spill_dir until the pool fits in the budget again.
+    The spill directory is removed when the pool is garbage collected (or at exit).
+
+    :param budget: The memory budget in bytes.
+    :type budget: int
+    :param spill_dir: A directory for the spilled chunks. A temporary directory is created if None.
+    :type spill_dir: str, optional
+    """
+
+    def __init__(self, budget, spill_dir=None):
+        self.budget = budget
+        if spill_dir:
+            _create_dir_path(spill_dir)
+        else:
+            spill_dir = tempfile.mkdtemp(prefix='simmon-chunks-')
+        self.spill_dir = spill_dir
+        self.resident_bytes = 0
+        self._resident = OrderedDict()  # least recently used first
+        self._n_files = 0
+        weakref.finalize(self, shutil.rmtree, spill_dir, True)
+
+    def __reduce__(self):
+        # a copy of the Monitor (e.g. in the live view process) doesn't need the chunks
+        return type(None), ()
+
+    def new_path(self):
+        """Get a path for the file of a new chunk.
+
+        :return: A file path in the spill directory.
+        :rtype: str
+        """
+        self._n_files += 1
+        return f'{self.spill_dir}/{self._n_files}.bin'
+
+    def touch(self, chunk):
+        """Mark a chunk as the most recently used one. If the chunk
+        has just been allocated or loaded, other chunks are spilled as needed.
+
+        :param chunk: A chunk that is in memory.
+        :type chunk: _Chunk
+        """
+        if chunk in self._resident:
+            self._resident.move_to_end(chunk)
+            return
+
+        self._resident[chunk] = chunk.nbytes
+        self.resident_bytes += chunk.nbytes
+        while self.resident_bytes > self.budget:
+            oldest = next(iter(self._resident))
+            if oldest is chunk:  # never spill the chunk that's being used
+                break
+            self.resident_bytes -= self._resident.pop(oldest)
+            oldest.spill()
+
+
+class _Chunk:
+    """A fixed-size block of rows of a _ChunkedStore.
+    The chunk's columns are either in memory, or spilled to its binary file,
+    in which case columns is None. The file holds the raw bytes of the columns one
+    after the other. A chunk whose file is up to date (clean) is spilled without writing.
+
+    :param dtypes: A numpy data type for each column.
+    :type dtypes: list
+    :param n_rows: The number of rows in the chunk.
+    :type n_rows: int
+    :param _path: Path to the chunk's file.
+    :type _path: str
+    """
+
+    def __init__(self, dtypes, n_rows, _path):
+        self.columns = [np.empty(n_rows, dtype=dtype) for dtype in dtypes]
+        self.nbytes = sum([column.nbytes for column in self.columns])
+        self.path = _path
+        self.clean = False
+        self._dtypes = dtypes
+        self._n_rows = n_rows
+
+    def spill(self):
+        """Write the chunk to its file (if it has changed) and free its memory.
+        """
+        if not self.clean:
+            with open(self.path, 'wb') as file:
+                for column in self.columns:
+                    column.tofile(file)
+            self.clean = True
+        self.columns = None
+
+    def load(self):
+        """Read the chunk back into memory from its file.
+        """
+        with open(self.path, 'rb') as file:
+            self.columns = [np.fromfile(file, dtype=dtype, count=self._n_rows) for dtype in self._dtypes]
+
+
+class _ChunkedStore(_ColumnStore):
+    """Columnar storage for Tracker data, kept in fixed-size chunks under a memory budget.
+    The rows are stored in _Chunks of chunk_rows rows, whose memory is managed by a _ChunkPool
+    that is shared with the other trackers of the Monitor. Chunks that were spilled to disk
+    are loaded back transparently when they're accessed.
+    Since the data isn't contiguous, columns() returns copies. iter_chunks() goes over
+    the data a chunk at a time instead, without having all of it in memory at once.
+
+    :param n_columns: The number of variables (independent variable included).
+    :type n_columns: int
+    :param pool: The pool that manages the memory of the chunks.
+    :type pool: _ChunkPool
+    :param dtypes: A numpy data type for each column. Default is float64 for all columns.
+    :type dtypes: list, optional
+    :param chunk_rows: The number of rows in each chunk.
+    :type chunk_rows: int, optional
+    """
+
+    def __init__(self, n_columns, pool, dtypes=None, chunk_rows=65536):
+        self._dtypes = [np.dtype(dtype) for dtype in dtypes or [np.float64] * n_columns]
+        self._pool = pool
+        self._chunks = []
+        self._size = 0
+        self.chunk_rows = chunk_rows
+
+    def __reduce__(self):
+        # copies (e.g. in the live view process) are plain in-memory stores
+        return _ColumnStore.from_columns, (self.columns(),)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(zip(*[column[index].tolist() for column in self.columns()]))
+
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Tracker data index out of range.")
+
+        chunk_index, offset = divmod(index, self.chunk_rows)
+        return tuple(column[offset].item() for column in self._chunk_columns(chunk_index))
+
+    def __iter__(self):
+        for columns in self.iter_chunks():
+            yield from zip(*[column.tolist() for column in columns])
+
+    @property
+    def dtypes(self):
+        """The numpy data types of the columns."""
+        return self._dtypes
+
+    def append(self, row):
+        """Append a single row of values, one per column.
+
+        :param row: A sequence of values, ordered like the columns.
+        :type row: sequence
+        """
+        chunk_index, offset = divmod(self._size, self.chunk_rows)
+        if not offset:
+            self._new_chunk()
+
+        chunk = self._chunks[chunk_index]
+        for column, value in zip(chunk.columns or self._chunk_columns(chunk_index), row):
+            column[offset] = value
+        chunk.clean = False
+        self._size += 1
+
+    def extend(self, columns):
+        """Append a block of rows, given column by column.
+
+        :param columns: A sequence of equal-length 1-D arrays, ordered like the columns.
+        :type columns: sequence
+        """
+        start, n_rows = 0, len(columns[0])
+        while start < n_rows:
+            chunk_index, offset = divmod(self._size, self.chunk_rows)
+            if not offset:
+                self._new_chunk()
+
+            count = min(self.chunk_rows - offset, n_rows - start)
+            for column, values in zip(self._chunk_columns(chunk_index), columns):
+                column[offset:offset + count] = values[start:start + count]
+            self._chunks[chunk_index].clean = False
+            self._size += count
+            start += count
+
+    def columns(self):
+        """Get the data of each column. The chunks are copied into
+        contiguous arrays, so these are not views.
+
+        :return: A list of 1-D numpy arrays.
+        :rtype: list
+        """
+        parts = list(self.iter_chunks())
+        if len(parts) == 1:
+            return parts[0]
+        if not parts:
+            return [np.empty(0, dtype=dtype) for dtype in self._dtypes]
+        return [np.concatenate(column_parts) for column_parts in zip(*parts)]
+
+    def iter_chunks(self):
+        """Iterate over the data a chunk at a time, loading spilled chunks as needed.
+
+        :return: An iterator of lists of 1-D numpy arrays, one per column.
+        :rtype: iterator
+        """
+        for chunk_index in range(len(self._chunks)):
+            n_rows = min(self.chunk_rows, self._size - chunk_index * self.chunk_rows)
+            yield [column[:n_rows] for column in self._chunk_columns(chunk_index)]
+
+    def _chunk_columns(self, chunk_index):
+        """Get the columns of a chunk, loading it into memory if it's been spilled.
+
+        :param chunk_index: The index of the chunk.
+        :type chunk_index: int
+        :return: The full-size columns of the chunk.
+        :rtype: list
+        """
+        chunk = self._chunks[chunk_index]
+        if chunk.columns is None:
+            chunk.load()
+        columns = chunk.columns
+        self._pool.touch(chunk)
+        return columns
+
+    def _new_chunk(self):
+        """Allocate a new chunk at the end of the data.
+        """
+        chunk = _Chunk(self._dtypes, self.chunk_rows, self._pool.new_path())
+        self._chunks.append(chunk)
+        self._pool.touch(chunk)
+
+
+class Toggle:
+    """This class represents a toggle button.
+    It is supposed to be a helper to Monitor, with which
+    you can add toggles through the add_toggle() method.
+    But it can also work independently.
+    This class has two "modes":
+    Each object is either the main_toggle, which
+    means that it's in charge of starting the helper process (see _Helper) which opens
+    the window of toggles. Or - it isn't the main toggle, and then it is joined
+    to a main_toggle. The main toggle's helper process accepts new toggles and adds them to
+    its tkinter window.
+    A 'toggle' is simply a button that can be pressed by the user as many times as they like.
+    Whenever the user presses the button, a count variable is incremented.
+    Additionally, Toggle has a toggle_count member that keeps track of all toggles
+    made so far and "discovered" (i.e. `toggled()` returned True for them).
+    When the method `toggled()` is then invoked, True is returned if the count is bigger
+    than toggle_count, and toggle_count gets incremented. Thus, the method `toggled()` returns
+    True for every toggle made by the user.
+    The counts of all toggles in a window live in a shared memory array (one slot per toggle,
+    up to MAX_TOGGLES), so `toggled()` is a plain memory read. Each slot is only written by
+    the helper process.
+    Instead of polling `toggled()`, a toggle can also be waited for with `wait()`, or handled
+    by callbacks registered with `on_toggle()`. The helper process reports every press through a
+    queue, and a dispatcher thread (see _dispatch_toggles()) wakes the waiters
+    and calls the callbacks of the pressed toggle right away.
+    When closing a toggle, its button gets disabled but still appears as long as other toggles
+    are enabled. When all toggles joined in the same window are closed (and the live view isn't open),
+    then the window and helper process are closed.
+
+    :param main_toggle: A main toggle that's in charge of starting the helper process,
+        which then creates a window and accepts other toggles. If None, then this object
+        would be a main toggle itself.
+    :type main_toggle: Toggle, None
+    :param name: A name for the Toggle. The name appears on the button.
+    :type name: str, optional
+    :param desc: A description for the Toggle. The description appears above the button.
+    :type desc: str, optional
+    :param window_title: A title for the toggles window. This is relevant if this
+        toggle is the main_toggle, as it opens the process that opens the window.
+    :type window_title: str, optional
+    :param mp_context: The multiprocessing context used to start the helper process. This is
+        relevant if this toggle is the main_toggle. Default is None (the default context).
+    :type mp_context: str, multiprocessing.context.BaseContext, optional
+    """
+
+    def __init__(self, main_toggle, name='Toggle', desc="Press to toggle", window_title="Toggle(s)",
+                 mp_context=None):
+        self.toggle_count = 0
+        self.callbacks = []
+        self.window_closed = False  # set by the dispatcher thread when the toggles window is gone
+        self._condition = threading.Condition()
+        self._async_waiters = []  # functions that wake the coroutines waiting in wait_async()
+
+        if not main_toggle:
+            self.main = True
+            self.helper = _Helper(window_title, mp_context)
+        else:
+            self.main = False
+            self.helper = main_toggle.helper
+
+        self.counts = self.helper.counts
+        self.id = self.helper.add_toggle(self, name, desc)
+
+    def toggled(self):
+        """Returns True for every toggle made by the user.
+        Each time a user presses the toggle, a count is incremented.
+        This method returns True if the count is bigger than the number of toggles
+        already discovered (toggle_count), and increments toggle_count.
+
+        :return: True if the button has been toggled. False if it hasn't.
+        :rtype: bool
+        """
+        with self._condition:
+            if self.counts[self.id] > self.toggle_count:
+                self.toggle_count += 1
+                return True
+            return False
+
+    def wait(self, timeout=None):
+        """Block until the user toggles, and discover the toggle like `toggled()` does.
+        Returns right away if there's a toggle that hasn't been discovered yet.
+
+        :param timeout: The maximum time to wait, in seconds. Default is None (no limit).
+        :type timeout: float, optional
+        :return: True if the button has been toggled. False if the timeout expired
+            or the toggles window has been closed.
+        :rtype: bool
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self.window_closed or self.counts[self.id] > self.toggle_count,
+                                     timeout)
+            return self.toggled()
+
+    async def wait_async(self, timeout=None):
+        """The async version of wait(). Awaiting the Toggle itself
+        (await toggle) is the same as calling this method with no timeout.
+
+        :param timeout: The maximum time to wait, in seconds. Default is None (no limit).
+        :type timeout: float, optional
+        :return: True if the button has been toggled. False if the timeout expired
+            or the toggles window has been closed.
+        :rtype: bool
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        while not self.toggled():
+            remaining = None if deadline is None else deadline - loop.time()
+            if self.window_closed or (remaining is not None and remaining <= 0):
+                return False
+
+            future = loop.create_future()
+
+            def wake():
+                loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+            with self._condition:
+                if self.counts[self.id] > self.toggle_count or self.window_closed:
+                    continue  # toggled while the future was being created
+                self._async_waiters.append(wake)
+            try:
+                await asyncio.wait_for(future, remaining)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self._condition:
+                    if wake in self._async_waiters:
+                        self._async_waiters.remove(wake)
+
+        return True
+
+    def __await__(self):
+        return self.wait_async().__await__()
+
+    def on_toggle(self, callback):
+        """Register a function to be called whenever the user toggles.
+        The function receives this Toggle object, and is called from a background thread,
+        so it should be short. Callbacks don't discover toggles, so `toggled()`
+        still returns True for the same toggles (a callback may call it itself).
+
+        :param callback: A function that receives a Toggle.
+        :type callback: callable
+        :return: The callback, so that this method can be used as a decorator.
+        :rtype: callable
+        """
+        self.callbacks.append(callback)
+        return callback
+
+    def close(self):
+        """Closes this toggle. If other toggles
+        in the window are still enabled, this toggle's button
+        will still appear but will become disabled. When all
+        toggles in the window are closed, then the window is closed as well.
+
+        """
+        self.helper.close_toggle(self.id)
+
+
+class _Helper:
+    """Helper to Monitor and Toggle.
+    Starts and talks to the helper process (see _helper_process()), a single long-lived process
+    that hosts both the toggles window and the live view. All instructions, as well as the new
+    values sent by trackers to the live view, go through a single queue, in order. Toggle presses
+    come back through a second queue, on which a dispatcher thread waits (see _dispatch_toggles()),
+    and the toggle counts are shared through a shared memory array (see Toggle).
+
+    :param window_title: A title for the toggles window.
+    :type window_title: str
+    :param mp_context: A multiprocessing context, or the name of a start method. Default is None
+        (the default context).
+    :type mp_context: str, multiprocessing.context.BaseContext, optional
+    """
+
+    def __init__(self, window_title, mp_context=None):
+        import multiprocessing
+
+        if mp_context is None or isinstance(mp_context, str):
+            mp_context = multiprocessing.get_context(mp_context)
+
+        self.queue = mp_context.Queue()  # instructions and live view data
+        presses_q = mp_context.Queue()
+        self.counts = mp_context.RawArray('q', MAX_TOGGLES)
+        self.toggles = []  # all toggles in the window, by id
+        self.closed = set()  # IDs of closed toggles
+        self.live_view = False
+
+        self.process = mp_context.Process(target=_helper_process, args=(self.queue, presses_q, self.counts,
+                                                                        window_title))
+
+        # start the helper process on the calling thread, before the dispatcher thread exists, so that
+        # forking never happens from a thread. start() doesn't wait for the process to be ready:
+        # instructions sent meanwhile wait in the queue
+        self.process.start()
+
+        self._dispatcher = threading.Thread(target=_dispatch_toggles, args=(presses_q, self.toggles),
+                                            name='simmon-toggles', daemon=True)
+        self._dispatcher.start()
+
+    def add_toggle(self, toggle, name, desc):
+        """Add a toggle button to the toggles window.
+
+        :param toggle: The new toggle.
+        :type toggle: Toggle
+        :param name: The name of the toggle.
+        :type name: str
+        :param desc: The description of the toggle.
+        :type desc: str
+        :return: The ID of the toggle.
+        :rtype: int
+        """
+        if len(self.toggles) == MAX_TOGGLES:
+            raise Exception(f"Too many toggles! A toggles window can hold at most {MAX_TOGGLES} toggles.")
+
+        self.toggles.append(toggle)
+        self.send('add_toggle', name, desc)
+        return len(self.toggles) - 1
+
+    def close_toggle(self, _id):
+        """Close a toggle button.
+
+        :param _id: The ID of the toggle.
+        :type _id: int
+        """
+        self.closed.add(_id)
+        self.send('close_toggle', _id)
+
+    def open_live_view(self, monitor_data, update_rate):
+        """Open the live view (see _LiveView).
+
+        :param monitor_data: A pickled monitor clone.
+        :type monitor_data: bytes
+        :param update_rate: How many updates to perform per second.
+        :type update_rate: float
+        """
+        self.live_view = True
+        self.send('open_live_view', monitor_data, update_rate)
+
+    def close_live_view(self):
+        """Close the live view.
+        """
+        self.live_view = False
+        self.send('close_live_view')
+
+    @property
+    def finished(self):
+        """Whether the helper process ends, because all its toggles are closed
+        and the live view isn't open.
+
+        :rtype: bool
+        """
+        return len(self.closed) == len(self.toggles) and not self.live_view
+
+    def send(self, *instruction):
+        """Send an instruction to the helper process (see _helper_process()).
+
+        :param instruction: The name of the instruction, followed by its arguments.
+        """
+        self.queue.put(instruction)
+
+
+class _InertToggle(Toggle):
+    """A toggle that's never toggled, returned by add_toggle() of a headless Monitor,
+    so that code that checks toggles runs unchanged without a toggles window.
+
+    :param name: A name for the Toggle.
+    :type name: str, optional
+    :param desc: A description for the Toggle.
+    :type desc: str, optional
+    """
+
+    def __init__(self, name='Toggle', desc="Press to toggle"):
+        self.name = name
+        self.desc = desc
+        self.toggle_count = 0
+        self.callbacks = []
+        self.window_closed = True  # so that wait() returns right away
+        self._condition = threading.Condition()
+        self._async_waiters = []
+
+        self.main = False
+        self.id = 0
+        self.counts = [0]
+
+    def close(self):
+        pass
+
+
+# -----------------
+# UTILITY FUNCTIONS
+# -----------------
+class _LiveView:
+    """Helper to the helper process (see _helper_process()).
+    The live view of a Monitor. It receives a copy of the Monitor object and an update rate.
+    When opened, the live view still doesn't show anything. When a Tracker
+    in the MAIN process gets updated with new values (aka via tracker.update()),
+    it then sends the new values to the helper process, along with the Tracker's ID.
+    A block of values added with tracker.update_many() is sent as a single list of columns.
+    Only then does the live view starts showing its updating plot.
+    This is done so that only currently-updating trackers are plotted in the live view.
+    If another tracker will later get updated as well, it will also be plotted and added to the
+    live view figure.
+    New values are stored as soon as they arrive, but the plots are only updated every
+    once in a while, according to the update_rate.
+
+    :param monitor_data: A pickled monitor clone.
+    :type monitor_data: bytes
+    :param update_rate: How many updates to perform per second.
+    :type update_rate: float
+    """
+
+    def __init__(self, monitor_data, update_rate):
+        matplotlib.use('TkAgg')
+
+        self.monitor = pickle.loads(monitor_data)
+        self.update_interval = 1 / update_rate
+
+        # create an id_to_tracker dictionary
+        self.id_to_tracker = dict()
+        for trackers in self.monitor.titled_trackers.values():
+            for tracker in trackers:
+                self.id_to_tracker[tracker._id] = tracker
+
+        self.trackers = []
+        self.id_to_axes = dict()
+        self.figure = None
+
+        self._redraw = False  # whether new trackers need to be added to the figure
+        self._updated = set()  # IDs of trackers whose plots need to be updated
+        self._last_update = 0
+
+    def add(self, _id, data):
+        """Add new values to a tracker.
+
+        :param _id: The ID of the tracker.
+        :type _id: float
+        :param data: Either a single row, or a block of columns sent by update_many().
+        :type data: tuple, list
+        """
+        # check if id is known to the live view, because
+        # it could be a new id that hasn't been sent to the process in advance
+        tracker = self.id_to_tracker.get(_id)
+        if tracker is None:
+            return
+
+        if isinstance(data, list):
+            tracker._extend_data(data)
+        else:
+            tracker.data.append(data)
+
+        if tracker not in self.trackers:  # if new tracker
+            self.trackers.append(tracker)
+            self._redraw = True
+        else:
+            self._updated.add(_id)
+
+    def refresh(self, now):
+        """Update the plots, if it's time to.
+
+        :param now: The current time, as given by time.monotonic().
+        :type now: float
+        """
+        if now - self._last_update < self.update_interval:
+            return
+        self._last_update = now
+
+        if self._redraw:
+            # redraw figure, and update id_to_axes
+            self.figure, axs = _redraw_live_view(self.monitor, self.figure, self.trackers)
+            self.id_to_axes = {tracker._id: axes for tracker, axes in zip(self.trackers, axs)}
+            self._redraw = False
+
+        elif self._updated:
+            # update the appropriate axes
+            for _id in self._updated:
+                _update_live_view_axes(self.id_to_tracker[_id], self.id_to_axes[_id])
+            self.figure.canvas.draw_idle()
+
+        self._updated.clear()
+
+    def close(self):
+        """Close the live view figure.
+        """
+        if self.figure:
+            plt.close(self.figure)
+
+
+def _redraw_live_view(monitor, prev_figure, trackers):
+    """Helper to the live view (see _LiveView).
+    Whenever new trackers get updated, their plots
+    should be added to the live view figure. In this case, a new figure
+    needs to be created.
+
+    :param monitor: The monitor clone containing the tracker objects.
+    :type monitor: Monitor
+    :param prev_figure: The previous figure.
     :type prev_figure: matplotlib.Figure
     :param trackers: The updated list of trackers to be plotted.
     :type trackers: iterable
@@ -708,7 +3473,7 @@ def _redraw_live_view(monitor, prev_figure, trackers):
     :rtype: tuple
     """
     if prev_figure:
-        plt.close()
+        plt.close(prev_figure)
 
     figure, axs = _monitor_plot(monitor, *trackers, return_figure_and_axs=True)
     figure.canvas.manager.set_window_title('Monitor (live-view mode)')
@@ -716,14 +3481,12 @@ def _redraw_live_view(monitor, prev_figure, trackers):
     return figure, axs
 
 
-def _update_live_view_axes(new_data, tracker, axes):
-    """Helper to the live view process.
+def _update_live_view_axes(tracker, axes):
+    """Helper to the live view (see _LiveView).
     Update a single live-view axes with a single tracker's plot.
-    This function takes the tracker being plotted, the axes on which it's done,
-    and the new values added to the data - in order to update the plot with the new values.
+    This function takes the tracker being plotted and the axes on which it's done,
+    in order to update the plot with the new values.
 
-    :param new_data: A tuple of new data values.
-    :type new_data: tuple
     :param tracker: The tracker whose plot needs to get updated.
         This tracker MUST include the updated values already.
     :type tracker: Tracker
@@ -732,48 +3495,21 @@ def _update_live_view_axes(new_data, tracker, axes):
     """
 
     # update x and y values, and also keep track of x and y limits
-    min_x = np.inf  # these are used for the plot's x limit
-    max_x = -np.inf
-    xs = np.empty(len(tracker.data))
-    for i in range(len(tracker.data)):
-        x = tracker.data[i][0]
-        xs[i] = x
-
-        if x < min_x:
-            min_x = x
-        elif x > max_x:
-            max_x = x
-
-    if max_x == -np.inf:  # if hasn't changed
-        max_x = 1
-
-    if min_x == np.inf:  # if hasn't changed
-        min_x = max_x - 1
+    xs, *columns = tracker.columns()
+    min_x, max_x = _column_limits(xs)  # these are used for the plot's x limit
 
     min_y = np.inf  # for the plot's y limit
     max_y = -np.inf
-    i = 1
-    for line in axes.get_lines():
-
-        ys = np.empty(len(tracker.data))
-        for j in range(len(tracker.data)):
-            y = tracker.data[j][i]
-            ys[j] = y
-
-            if y < min_y:
-                min_y = y
-            elif y > max_y:
-                max_y = y
-
+    for line, ys in zip(axes.get_lines(), columns):
         line.set_xdata(xs)
         line.set_ydata(ys)
-        i += 1
 
-    if max_y == -np.inf:  # if hasn't changed
-        max_y = 1
+        column_min, column_max = _column_limits(ys)
+        min_y = min(min_y, column_min)
+        max_y = max(max_y, column_max)
 
-    if min_y == np.inf:  # if hasn't changed
-        min_y = max_y - 1
+    if max_y == -np.inf:  # if there are no lines
+        min_y, max_y = 0, 1
 
     # update x and y limits
     pad_x = (max_x - min_x) / 35
@@ -782,42 +3518,140 @@ def _update_live_view_axes(new_data, tracker, axes):
     axes.set_ylim(min_y - pad_y, max_y + pad_y)
 
 
+def _column_limits(values):
+    """Helper to _update_live_view_axes.
+    Finds the range of values that an axis should show for a data column.
+    An empty column gets a default range of (0, 1), and a constant column
+    gets a range of length 1 around its value.
+
+    :param values: A column of data values.
+    :type values: numpy.ndarray
+    :return: A (min, max) tuple.
+    :rtype: tuple
+    """
+    if not len(values):
+        return 0, 1
+
+    min_value, max_value = float(np.min(values)), float(np.max(values))
+    if min_value == max_value:
+        return min_value - 0.5, max_value + 0.5
+    return min_value, max_value
+
+
 def _refresh_monitor_toggles(monitor):
     """Helper to handle the default toggles of Monitor.
     When a Monitor is created, some toggles are added to it
     by default. These toggles then listen for user presses and
     remember them.
     But someone has to take care of what to do when they're
-    toggled. This function is called in every tracker update
-    of the monitor (see Tracker.update()). It checks if any of the default monitor toggles
-    has been toggled, and if so, it operates accordingly.
+    toggled. The presses are picked up by callbacks of these toggles (see _default_toggle_callback()),
+    which record them in the monitor's _toggle_events. This function is called in every tracker update
+    of the monitor (see Tracker.update()). It only reads the recorded presses, so it costs
+    almost nothing when there are none, and operates accordingly.
     For example, it opens the live-view if the live-view toggle has been pressed.
 
     :param monitor: The monitor whose default toggles would be checked.
     :type monitor: Monitor
     """
-    # if live view toggle toggled
-    if getattr(monitor, 'live_view_toggle', False) and monitor.live_view_toggle.toggled():
-        if monitor.live_view_toggle.toggle_count % 2:
+    events = getattr(monitor, '_toggle_events', None)
+    while events:
+        event = events.popleft()
+
+        # if live view toggle toggled
+        if event == 'open_live_view':
             monitor.open_live_view()
-        else:
+        elif event == 'close_live_view':
             monitor.close_live_view()
 
-    # if plot toggle toggled
-    if getattr(monitor, 'plot_toggle', False) and monitor.plot_toggle.toggled():
-        titles = [title for title in monitor.titled_trackers if title != "no_title"]
+        # if plot toggle toggled
+        elif event == 'plot':
+            titles = [title for title in monitor.titled_trackers if title != "no_title"]
+
+            # add plots of untitled trackers, grouped by ind_var_name
+            if 'no_title' in monitor.titled_trackers:
+                groups = {}
+                for tr in monitor.titled_trackers['no_title']:
+                    if tr.ind_var_name in groups:
+                        groups[tr.ind_var_name].append(tr)
+                    else:
+                        groups[tr.ind_var_name] = [tr]
+                titles.extend(groups.values())
+
+            monitor.plot(*titles)
+
+
+def _default_toggle_callback(events, kind):
+    """Helper to Monitor.
+    Creates a callback for one of the default toggles of a monitor (see Toggle.on_toggle()).
+    The callback runs in the toggles dispatcher thread, so it only records every press
+    as an event in a deque: 'open_live_view' / 'close_live_view' for the live view toggle,
+    and 'plot' for the plot toggle. The events are then handled by the main thread in
+    tracker updates (see _refresh_monitor_toggles()), since opening the live view and
+    plotting must not happen in a background thread.
+
+    :param events: A deque to which the events are appended.
+    :type events: collections.deque
+    :param kind: Either 'live_view' or 'plot'.
+    :type kind: str
+    :return: A callback that receives a Toggle.
+    :rtype: callable
+    """
+    def callback(toggle):
+        while toggle.toggled():
+            if kind == 'live_view':
+                events.append('open_live_view' if toggle.toggle_count % 2 else 'close_live_view')
+            else:
+                events.append(kind)
+
+    return callback
 
-        # add plots of untitled trackers, grouped by ind_var_name
-        if 'no_title' in monitor.titled_trackers:
-            groups = {}
-            for tr in monitor.titled_trackers['no_title']:
-                if tr.ind_var_name in groups:
-                    groups[tr.ind_var_name].append(tr)
-                else:
-                    groups[tr.ind_var_name] = [tr]
-            titles.extend(groups.values())
 
-        monitor.plot(*titles)
+def _dispatch_toggles(presses_q, toggles):
+    """Helper to Toggle class.
+    This is the dispatcher thread of a toggles window. It blocks on a queue to which
+    the window process puts the id of every toggle pressed, and for each press wakes
+    the threads and coroutines waiting for the toggle (see Toggle.wait()) and calls its callbacks
+    (see Toggle.on_toggle()). When the window process ends, it puts None in the queue,
+    and then all waiting threads are released and this thread ends.
+
+    :param presses_q: A queue of pressed toggle ids.
+    :type presses_q: multiprocessing.Queue
+    :param toggles: All toggles in the window, by id.
+    :type toggles: list
+    """
+    while (_id := presses_q.get()) is not None:
+        toggle = toggles[_id]
+        with toggle._condition:
+            toggle._condition.notify_all()
+            _wake_async_waiters(toggle)
+
+        for callback in list(toggle.callbacks):
+            try:
+                callback(toggle)
+            except Exception as e:  # a failing callback shouldn't stop the other toggles
+                warnings.warn(f"Exception in a callback of toggle '{_id}': {e!r}")
+
+    for toggle in toggles:
+        with toggle._condition:
+            toggle.window_closed = True
+            toggle._condition.notify_all()
+            _wake_async_waiters(toggle)
+
+
+def _wake_async_waiters(toggle):
+    """Helper to _dispatch_toggles().
+    Wakes all coroutines waiting for a toggle (see Toggle.wait_async()).
+    The toggle's condition must be held by the caller.
+
+    :param toggle: A toggle.
+    :type toggle: Toggle
+    """
+    waiters, toggle._async_waiters = toggle._async_waiters, []
+    for wake in waiters:
+        try:
+            wake()
+        except RuntimeError:  # the event loop of the waiter has been closed
+            pass
 
 
 def _monitor_plot(monitor, *args, return_figure_and_axs=False):
@@ -917,10 +3751,9 @@ def _plot_trackers(axes, trackers):
                              f" The iterable passed to _plot_trackers() must only contain"
                              f" Tracker objects.")
 
-        xs = [line[0] for line in tracker.data]
-        for i in range(len(tracker.dep_var_names)):
-            ys = [line[i + 1] for line in tracker.data]
-            axes.plot(xs, ys, label=tracker.dep_var_names[i])
+        xs, *columns = tracker.columns()
+        for ys, label in zip(columns, tracker.dep_var_names):
+            axes.plot(xs, ys, label=label)
 
     # set axis labels
     if len(trackers) == 1 and len((tr := next(iter(trackers))).dep_var_names) == 1:
@@ -935,39 +3768,67 @@ def _plot_trackers(axes, trackers):
         axes.legend()
 
 
-def _toggle_window(in_q, _counts, name, desc, window_title):
-    """Helper to Toggle class.
-    This is the listening process of the Toggles window.
-    This process initially creates a tkinter window, and adds a single
-    toggle button according to its arguments.
+def _helper_process(in_q, presses_q, _counts, window_title):
+    """Helper to _Helper class.
+    This is the helper process (see _helper_window()). Whether the window closes normally
+    or fails (e.g. when there's no display to open it on), None is put in the presses queue
+    at the end, so that the dispatcher thread releases all threads waiting for the toggles.
+
+    :param in_q: An instructions-queue used to receive instructions and live view data from
+        the main process.
+    :type in_q: multiprocessing.Queue
+    :param presses_q: A queue to which the id of every pressed toggle is put,
+        and None when the window is closed (see _dispatch_toggles()).
+    :type presses_q: multiprocessing.Queue
+    :param _counts: A shared array of counts used to keep track of toggles
+        made for each Toggle. This process only ever increments them.
+    :type _counts: multiprocessing.RawArray
+    :param window_title: A window title.
+    :type window_title: str
+    """
+    try:
+        _helper_window(in_q, presses_q, _counts, window_title)
+    finally:
+        presses_q.put(None)  # signal the dispatcher thread to stop
+
+
+def _helper_window(in_q, presses_q, _counts, window_title):
+    """Helper to _helper_process().
+    This runs the helper process, which hosts both the Toggles window and the live view.
+    This process initially creates a hidden tkinter window, which shows up when
+    the first toggle button is added.
     It then listens to user toggles, and also receives signals from the main
-    process through an instructions-queue.
-    These instructions are of two types:
-    1. Add a new toggle. This is followed with information about a new
-    toggle button to be added to the window. For an explanation
+    process through a single instructions-queue.
+    These instructions are tuples, whose first element is the name of the instruction:
+    1. 'add_toggle' - Add a new toggle. This comes with the name and description
+    of a new toggle button to be added to the window. For an explanation
     of how and why toggles are added in this way, see Toggle.
-    2. Close a toggle button. This comes with the ID of the Toggle
+    2. 'close_toggle' - Close a toggle button. This comes with the ID of the Toggle
     button to close. When a toggle is closed, its
-    button gets disabled, but it is not removed from the window. When all toggles
-    are closed, then the window is closed and this process terminates.
+    button gets disabled, but it is not removed from the window.
+    3. 'open_live_view' - Open the live view. This comes with a pickled copy of the
+    Monitor, and the live view's update rate (see _LiveView).
+    4. 'close_live_view' - Close the live view.
+    Any other tuple is a tracker's ID followed by new values for the live view.
+    When all toggles are closed and the live view isn't open, then the window is closed
+    and this process terminates.
 
     Additionally, this process takes care of preventing the computer
     from going into sleep mode. This is done by pressing the harmless 'shift'
     key every once in a while.
 
-    :param in_q: An instructions-queue used to receive instructions from
+    :param in_q: An instructions-queue used to receive instructions and live view data from
         the main process.
     :type in_q: multiprocessing.Queue
-    :param _counts: An array-like of counts used to keep track of toggles
-        made for each Toggle.
-    :type _counts: numpy.ndarray, list
-    :param name: The name of the initial main-toggle.
-    :type name: str
-    :param desc: Description for the main-toggle.
-    :type desc: str
+    :param presses_q: A queue to which the id of every pressed toggle is put.
+    :type presses_q: multiprocessing.Queue
+    :param _counts: A shared array of counts used to keep track of toggles
+        made for each Toggle. This process only ever increments them.
+    :type _counts: multiprocessing.RawArray
     :param window_title: A window title.
     :type window_title: str
     """
+    from tkinter import Tk, Label, PhotoImage, Button, Frame, TclError
 
     # Setting pyautogui FAILSAFE to False,
     # because FAILSAFE is a pyautogui feature
@@ -978,6 +3839,7 @@ def _toggle_window(in_q, _counts, name, desc, window_title):
     # programs could unexpectedly terminate when the user moves the
     # mouse to one of the corners.
     if keep_awake:
+        import pyautogui
         pyautogui.FAILSAFE = False
 
     # these are the background and foreground colors for the window
@@ -990,18 +3852,15 @@ def _toggle_window(in_q, _counts, name, desc, window_title):
     keep_awake_color = 'grey'
 
     window = Tk()
+    window.withdraw()  # shown when the first toggle is added
     window.configure(bg=bg)
     window.title(window_title)
 
     # these next few lines set the window icon
-    icon_url = "https://raw.githubusercontent.com/roiezemel/simmon/main/assets/simmon_logo.png"
     try:
-        u = urlopen(icon_url, timeout=1)  # the window icon is not worth more than a second
-        raw_data = u.read()
-        u.close()
-        icon = PhotoImage(data=raw_data)
+        icon = PhotoImage(data=_ICON_PNG)
         window.iconphoto(False, icon)
-    except (urllib.error.URLError, socket.timeout):
+    except TclError:  # Tk versions older than 8.6 can't read PNG images
         pass
 
     window.rowconfigure(0, weight=1)
@@ -1015,6 +3874,9 @@ def _toggle_window(in_q, _counts, name, desc, window_title):
     buttons = []
     closed = []
     width = 0
+    live_view = None
+    opened = False  # whether a toggle or the live view has been opened yet
+    last_press = 0
 
     def add_button(_name, _desc):
         """
@@ -1029,6 +3891,7 @@ def _toggle_window(in_q, _counts, name, desc, window_title):
 
         def on_toggle():
             _counts[index] += 1
+            presses_q.put(index)
 
         window.columnconfigure(columns, weight=1)
 
@@ -1048,44 +3911,71 @@ def _toggle_window(in_q, _counts, name, desc, window_title):
         width += (max(len(_desc), len(_name)) + 5) * 15
         window.geometry(f"{width}x300")
 
-    add_button(name, desc)
+        if columns == 1:
+            window.deiconify()
 
     def refresh():
         """
         This local function refreshes
-        the toggle windows:
-        - It listens to signals from main process
+        the helper process:
+        - It listens to instructions and live view data from main process
+        - It updates the live view
         - It keeps the computer awake by pressing the shift key
         """
+        nonlocal live_view, opened, last_press
+
+        now = time.monotonic()
 
         # press shift key
         # this is here to prevent the computer from going
         # into sleep mode
-        if keep_awake:
+        if keep_awake and now - last_press >= 3:
             pyautogui.press('shift')  # press shift key
+            last_press = now
 
-        keep_listening = True
-
+        # bound the work done per tick so a fast producer cannot starve
+        # the Tk event loop (buttons and the live view must stay responsive)
+        deadline = now + 0.02
+        handled = 0
         while not in_q.empty():
-            signal = in_q.get()
-            if signal == 1:  # add another window
-                _name = in_q.get()
-                _desc = in_q.get()
-                add_button(_name, _desc)
-
-            if signal == 2:  # close a toggle
-                _id = in_q.get()
-                closed[_id] = True
+            if handled >= 500 or time.monotonic() >= deadline:
+                break
+            instruction, *args = in_q.get()
+            handled += 1
+
+            if not isinstance(instruction, str):  # new values of a tracker
+                if live_view:
+                    live_view.add(instruction, args[0])
 
-                if all(closed):  # Then stop process
-                    window.destroy()
-                    keep_listening = False
-                    break
+            elif instruction == 'add_toggle':
+                add_button(*args)
+                opened = True
 
+            elif instruction == 'close_toggle':
+                _id, = args
+                closed[_id] = True
                 buttons[_id]['state'] = 'disabled'
 
-        if keep_listening:
-            window.after(3000, refresh)
+            elif instruction == 'open_live_view':
+                live_view = _LiveView(*args)
+                opened = True
+
+            elif instruction == 'close_live_view' and live_view:
+                live_view.close()
+                live_view = None
+
+        backlog = not in_q.empty()
+
+        if live_view:
+            live_view.refresh(now)
+
+        # then stop process
+        elif opened and all(closed) and not backlog:
+            window.destroy()
+            return
+
+        # come back right away while messages are still waiting
+        window.after(1 if backlog else 50, refresh)
 
     refresh()
 
@@ -1109,24 +3999,393 @@ def _determine_tracker_filename(tracker, dir_path, ending):
     :return: A filename for the Tracker's output.
     :rtype: str
     """
-    name = '-'.join([tracker.ind_var_name] + tracker.dep_var_names) + ending
-    while name in next(walk(dir_path), (None, None, []))[2]:
+    # a binary output file and its .csv export share a name, so they're taken together
+    endings = ('.csv', '.bin') if ending in ('.csv', '.bin') else (ending,)
+    filenames = next(walk(dir_path), (None, None, []))[2]
+
+    name = '-'.join([tracker.ind_var_name] + tracker.dep_var_names)
+    while any([name + _ending in filenames for _ending in endings]):
         name = "+" + name
-    return name.replace(':', '-')
+    return (name + ending).replace(':', '-')
 
 
 def _load_to_tracker(tracker, _path):
     """Loads data from an output .csv file into
-    a Tracker object.
+    a Tracker object. The values are parsed with the tracker's data types.
 
     :param tracker: A tracker object to load the data into.
     :type tracker: Tracker
     :param _path: Path to data file.
     :type _path: str
     """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')  # numpy warns about empty files
+        if tracker.dtypes:
+            # parse each column with its own data type, so that large integers stay exact
+            fields = [(f'f{i}', dtype) for i, dtype in enumerate(tracker.dtypes)]
+            table = np.loadtxt(_path, delimiter=',', dtype=fields, ndmin=1)
+            columns = [table[name] for name, _ in fields]
+        else:
+            columns = list(np.loadtxt(_path, delimiter=',', ndmin=2).T)
+
+    if not len(columns[0]):
+        return
+
+    tracker._extend_data(columns)
+
+
+@contextmanager
+def _atomic_open(_path, mode='w'):
+    """Open a file for writing, such that the file is replaced atomically.
+    The content is written to a temporary file next to it (the path + '.tmp'), which is
+    flushed to the disk and then renamed to replace the file. If writing fails, the temporary
+    file is removed and the file is left as it was.
+    Usage: with _atomic_open(_path) as file: ...
+
+    :param _path: Path to the file.
+    :type _path: str
+    :param mode: The mode to open the temporary file with, 'w' or 'wb'. Default is 'w'.
+    :type mode: str, optional
+    """
+    tmp_path = _path + '.tmp'
+    try:
+        with open(tmp_path, mode) as file:
+            yield file
+            file.flush()
+            fsync(file.fileno())
+    except BaseException:
+        if path.exists(tmp_path):
+            remove(tmp_path)
+        raise
+
+    replace(tmp_path, _path)
+
+
+def _recover_output_file(_path):
+    """Remove the partial last row that a crash could leave in a tracker's output file,
+    and in its spool file (see _AutosaveWriter), if there's one.
+    In a .csv file, this is a last line with no newline at its end. In a binary
+    .bin file (see _binary_header()), this is a last record that's shorter than a record.
+    The user is warned about every removed row.
+
+    :param _path: Path to a .csv or .bin output file.
+    :type _path: str
+    """
+    spool_path = _path + '.spool'
+    if _path.endswith('.bin'):
+        _, record_dtype, header_size = _read_binary_header(_path)
+        files = [(_path, header_size), (spool_path, 0)]  # the spool file has no header
+        record_size = record_dtype.itemsize
+    else:
+        files = [(_path, None), (spool_path, None)]
+
+    for file_path, header_size in files:
+        if not path.exists(file_path):
+            continue
+
+        size = path.getsize(file_path)
+        if header_size is None:
+            complete_size = _complete_lines_size(file_path, size)
+        else:
+            complete_size = header_size + (size - header_size) // record_size * record_size
+
+        if complete_size < size:
+            with open(file_path, 'r+b') as file:
+                file.truncate(complete_size)
+            warnings.warn(f"Removed a partial row ({size - complete_size} bytes) from the end of {file_path}, "
+                          f"which was probably cut off by a crash.")
+
+
+def _complete_lines_size(_path, size, block_size=65536):
+    """Helper to _recover_output_file().
+    Find the size of a text file up to (and including) its last newline.
+
+    :param _path: Path to the file.
+    :type _path: str
+    :param size: The size of the file.
+    :type size: int
+    :param block_size: The number of bytes read at once, from the end backwards. Default is 65536.
+    :type block_size: int, optional
+    :return: The size of the complete lines of the file.
+    :rtype: int
+    """
+    with open(_path, 'rb') as file:
+        end = size
+        while end > 0:
+            start = max(0, end - block_size)
+            file.seek(start)
+            newline = file.read(end - start).rfind(b'\n')
+            if newline != -1:
+                return start + newline + 1
+            end = start
+    return 0
+
+
+def _merge_spool(_path):
+    """Append the spool file of a tracker's output file (see _AutosaveWriter) to the output file,
+    and remove the spool file.
+
+    :param _path: Path to the output file.
+    :type _path: str
+    :return: False if the output file is still denying permission, True otherwise.
+    :rtype: bool
+    """
+    spool_path = _path + '.spool'
+    if not path.exists(spool_path):
+        return True
+
+    try:
+        with open(spool_path, 'rb') as spool, open(_path, 'ab') as out_file:
+            shutil.copyfileobj(spool, out_file)
+    except PermissionError:
+        return False
+
+    remove(spool_path)
+    return True
+
+
+_BINARY_MAGIC = b'SIMMON\x01\x01'  # the first bytes of a binary output file
+
+
+def _binary_record_dtype(dtypes):
+    """Get the structured data type of the records of a binary output file.
+
+    :param dtypes: A data type for each column.
+    :type dtypes: list
+    :return: A structured little-endian data type with a field per column ('f0', 'f1' ...).
+    :rtype: numpy.dtype
+    """
+    return np.dtype([(f'f{i}', np.dtype(dtype).newbyteorder('<')) for i, dtype in enumerate(dtypes)])
+
+
+def _binary_struct(record_dtype):
+    """Get a struct that packs a single row as a record of a binary output file, which is much faster
+    than going through numpy for a single row.
+
+    :param record_dtype: The structured data type of the records.
+    :type record_dtype: numpy.dtype
+    :return: A struct, or None if any of the data types has no struct format.
+    :rtype: struct.Struct, None
+    """
+    formats = {'f': {2: 'e', 4: 'f', 8: 'd'}, 'i': {1: 'b', 2: 'h', 4: 'i', 8: 'q'},
+               'u': {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}, 'b': {1: '?'}}
+    codes = [formats.get(record_dtype[i].kind, {}).get(record_dtype[i].itemsize)
+             for i in range(len(record_dtype.names))]
+    if None in codes:
+        return None
+    return struct.Struct('<' + ''.join(codes))
+
+
+def _binary_header(labels, record_dtype):
+    """Get the header of a binary output file.
+    The header is an 8-byte magic string, the size of the header (uint32) and a JSON object
+    with the data labels and data type names, padded with spaces to a multiple of 64 bytes.
+    It's followed by the records, which are never changed once written, so a crash can at most
+    leave a partial last record, which is ignored by _read_binary_file().
+
+    :param labels: The data labels, independent variable first.
+    :type labels: list
+    :param record_dtype: The structured data type of the records (see _binary_record_dtype()).
+    :type record_dtype: numpy.dtype
+    :return: The header.
+    :rtype: bytes
+    """
+    description = json.dumps({'labels': list(labels),
+                              'dtypes': [record_dtype[i].name for i in range(len(record_dtype.names))]}).encode()
+    header_size = -(-(12 + len(description)) // 64) * 64  # round up to a multiple of 64
+    return struct.pack('<8sI', _BINARY_MAGIC, header_size) + description.ljust(header_size - 12)
+
+
+def _read_binary_header(_path):
+    """Read the header of a binary output file (see _binary_header()).
+
+    :param _path: Path to the binary file.
+    :type _path: str
+    :return: The data labels, the structured data type of the records and the size of the header.
+    :rtype: tuple
+    """
+    with open(_path, 'rb') as file:
+        magic, header_size = struct.unpack('<8sI', file.read(12))
+        if magic != _BINARY_MAGIC:
+            raise ValueError(f"'{_path}' is not a tracker's binary output file.")
+        description = json.loads(file.read(header_size - 12).decode())
+
+    return description['labels'], _binary_record_dtype(description['dtypes']), header_size
+
+
+def _read_binary_file(_path):
+    """Read the data of a binary output file (see _binary_header()). The records are read
+    into memory as they are, without any parsing. A partial last record is ignored.
+
+    :param _path: Path to the binary file.
+    :type _path: str
+    :return: The data labels, and a list of columns (1-D numpy arrays in native byte order).
+    :rtype: tuple
+    """
+    labels, record_dtype, header_size = _read_binary_header(_path)
+    n_records = (path.getsize(_path) - header_size) // record_dtype.itemsize
+    records = np.fromfile(_path, dtype=record_dtype, count=n_records, offset=header_size)
+    columns = [records[name].astype(record_dtype[name].newbyteorder('='))
+               for name in record_dtype.names]
+    return labels, columns
+
+
+def _export_binary_to_csv(bin_path, csv_path, chunk_rows=100000):
+    """Export a binary output file (see _binary_header()) as a .csv file, chunk by chunk.
+
+    :param bin_path: Path to the binary file.
+    :type bin_path: str
+    :param csv_path: Path to the .csv file.
+    :type csv_path: str
+    :param chunk_rows: The number of rows converted at once. Default is 100000.
+    :type chunk_rows: int, optional
+    """
+    _, record_dtype, header_size = _read_binary_header(bin_path)
+    n_records = (path.getsize(bin_path) - header_size) // record_dtype.itemsize
+    dtypes = [record_dtype[name] for name in record_dtype.names]
+
+    with _atomic_open(csv_path) as out_file:
+        # a header, unless all data types are the default one
+        if any([dtype != np.float64 for dtype in dtypes]):
+            out_file.write(_csv_header(dtypes))
+
+        if n_records:
+            records = np.memmap(bin_path, dtype=record_dtype, mode='r', offset=header_size, shape=(n_records,))
+            for start in range(0, n_records, chunk_rows):
+                chunk = records[start:start + chunk_rows]
+                out_file.write(_format_csv_columns([np.asarray(chunk[name]) for name in record_dtype.names]))
+            del records
+
+
+def _format_csv_columns(columns):
+    """Format columns of data values as the content of a .csv file.
+    Low-precision floats are formatted by numpy, which writes the shortest
+    representation of their own precision (e.g. 0.1 instead of 0.10000000149011612).
+
+    :param columns: A sequence of equal-length 1-D numpy arrays.
+    :type columns: sequence
+    :return: The .csv content, one line per row.
+    :rtype: str
+    """
+    values = [column.astype(str).tolist() if column.dtype.kind == 'f' and column.dtype.itemsize < 8
+              else column.tolist() for column in columns]
+    return _format_csv_rows(zip(*values))
+
+
+def _csv_header(dtypes):
+    """Get the header line of a tracker's .csv file, which records its data types.
+    The line is a comment (starts with '#'), which is skipped when the file is parsed.
+    Trackers with default data types have no header.
+
+    :param dtypes: The data types of the tracker, or None.
+    :type dtypes: list, None
+    :return: The header line, or an empty string.
+    :rtype: str
+    """
+    if not dtypes:
+        return ''
+    return '# dtypes: ' + ','.join([np.dtype(dtype).name for dtype in dtypes]) + '\n'
+
+
+def _read_csv_dtypes(_path):
+    """Read the data types recorded in the header of a tracker's .csv file (see _csv_header()).
+
+    :param _path: Path to data file.
+    :type _path: str
+    :return: A list of numpy data types, or None if the file has no header.
+    :rtype: list, None
+    """
     with open(_path, 'r') as file:
-        for line in file.readlines():
-            tracker.data.append(tuple([float(d) for d in line.replace('\n', '').split(',')]))
+        line = file.readline()
+    if not line.startswith('# dtypes: '):
+        return None
+    return [np.dtype(name) for name in line[len('# dtypes: '):].strip().split(',')]
+
+
+def _normalize_dtypes(dtype, n_columns):
+    """Turn the dtype argument of a tracker into a list of numpy data types, one per column.
+
+    :param dtype: None, a single data type, or a sequence of data types.
+    :type dtype: str, numpy.dtype, sequence, None
+    :param n_columns: The number of variables (independent variable included).
+    :type n_columns: int
+    :return: A list of numpy data types, or None.
+    :rtype: list, None
+    """
+    if dtype is None:
+        return None
+
+    if isinstance(dtype, (list, tuple)):
+        if len(dtype) != n_columns:
+            raise ValueError(f"Amount of data types ({len(dtype)}) is "
+                             f"different than the amount of data labels ({n_columns}).")
+        dtypes = [np.dtype(d) for d in dtype]
+    else:
+        dtypes = [np.dtype(dtype)] * n_columns
+
+    for d in dtypes:
+        if d.kind not in 'iuf':
+            raise ValueError(f"Tracker data type must be an integer or a float type, not {d}!")
+    return dtypes
+
+
+def _format_csv_rows(rows):
+    """Format rows of data values as the content of a .csv file.
+
+    :param rows: An iterable of rows, each a sequence of values.
+    :type rows: iterable
+    :return: The .csv content, one line per row.
+    :rtype: str
+    """
+    return ''.join([','.join([str(v) for v in row]) + '\n' for row in rows])
+
+
+def _parse_size(size):
+    """Parse a size given either in bytes or as a string such as '2GB', '500 MB' or '1.5G'.
+
+    :param size: A number of bytes, or a size string.
+    :type size: int, str
+    :return: The number of bytes.
+    :rtype: int
+    """
+    if not isinstance(size, str):
+        return int(size)
+
+    units = {'': 1, 'B': 1, 'K': 1024, 'KB': 1024, 'M': 1024 ** 2, 'MB': 1024 ** 2,
+             'G': 1024 ** 3, 'GB': 1024 ** 3, 'T': 1024 ** 4, 'TB': 1024 ** 4}
+    number = size.strip().upper().rstrip('BKMGT ')
+    unit = size.strip().upper()[len(number):].strip()
+    if unit not in units:
+        raise ValueError(f"Invalid size '{size}'! Use a number of bytes or a string such as '2GB'.")
+    return int(float(number) * units[unit])
+
+
+def _format_size(n_bytes):
+    """Format a number of bytes as a human-readable size, such as '1.5 MB'.
+
+    :param n_bytes: A number of bytes.
+    :type n_bytes: int
+    :return: The formatted size.
+    :rtype: str
+    """
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if n_bytes < 1024:
+            return f'{n_bytes:.1f} {unit}' if unit != 'B' else f'{n_bytes} B'
+        n_bytes /= 1024
+    return f'{n_bytes:.1f} TB'
+
+
+def _detect_headless():
+    """Check whether there's a display to show windows on. On Linux and other Unix systems
+    (except macOS), windows need an X11 or Wayland display, given by the DISPLAY
+    or WAYLAND_DISPLAY environment variables. Windows and macOS always have a display.
+
+    :return: True if there's no display.
+    :rtype: bool
+    """
+    if sys.platform in ('win32', 'cygwin', 'darwin'):
+        return False
+    return not (environ.get('DISPLAY') or environ.get('WAYLAND_DISPLAY'))
 
 
 def _generate_directory(dir_name, super_directory):
@@ -0,0 +1,58 @@
+"""Regression test: rows autosaved while the output file is locked are spooled,
+and none are lost when the spool is merged back into the file during updates.
+
+Run from the repository root:
+    python -m pytest tests
+"""
+import builtins
+import sys
+import time
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'simmon'))
+
+import simmon  # noqa: E402
+
+
+def test_no_rows_lost_when_unlocked_during_updates(tmp_path, monkeypatch):
+    locked = set()
+
+    def locking_open(file, mode='r', *args, **kwargs):
+        if file in locked and mode[0] in 'aw':
+            raise PermissionError(file)
+        return builtins.open(file, mode, *args, **kwargs)
+
+    monkeypatch.setattr(simmon, 'open', locking_open, raising=False)
+    monkeypatch.setattr(simmon, 'SPOOL_RETRY_INTERVAL', 0.01)
+
+    mon = simmon.Monitor('spool', super_directory=str(tmp_path), enable_toggles=False, headless=True)
+    tracker = mon.tracker('x', 'y', autosave=True, flush_every=1)
+    writer = tracker._writer
+
+    tracker.update(0, 0)
+    writer._close_file()
+    locked.add(tracker.path)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        # rows go to the spool file while the output file is locked
+        for n_rows in range(1, 101):
+            tracker.update(n_rows, n_rows)
+        assert writer._spool_path is not None
+
+        # the merge thread merges the spool file, while rows keep coming
+        locked.discard(tracker.path)
+        deadline = time.monotonic() + 10
+        while writer._spool_path is not None:
+            assert time.monotonic() < deadline, "the spool file is never merged"
+            n_rows += 1
+            tracker.update(n_rows, n_rows)
+        for _ in range(100):
+            n_rows += 1
+            tracker.update(n_rows, n_rows)
+        mon.finalize()
+
+    with open(tracker.path) as file:
+        xs = [int(float(line.split(',')[0])) for line in file]
+    assert xs == list(range(n_rows + 1))
@@ -0,0 +1,67 @@
+"""Regression test: an error raised while the autosave writer thread writes is raised by
+finalize() (instead of stopping the thread and leaving finalize() waiting for it forever),
+and the rows of the other trackers are still saved.
+
+Run from the repository root:
+    python -m pytest tests
+"""
+import struct
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'simmon'))
+
+import simmon  # noqa: E402
+
+
+def finalize_with_timeout(mon, timeout=5):
+    result = {}
+
+    def target():
+        try:
+            mon.finalize()
+        except Exception as error:
+            result['error'] = error
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "finalize() hangs"
+    return result.get('error')
+
+
+def test_write_error_is_raised_by_finalize(tmp_path):
+    mon = simmon.Monitor('autosave', super_directory=str(tmp_path), enable_toggles=False, headless=True,
+                         autosave_thread=True)
+    bad = mon.tracker('x', 'y', autosave=True, autosave_format='binary')
+    good = mon.tracker('a', 'b', autosave=True)
+
+    bad.update(0, None)  # can't be packed as a binary record
+    good.update(1, 2)
+
+    assert isinstance(finalize_with_timeout(mon), struct.error)
+    with open(good.path) as file:
+        assert file.read().splitlines()[-1] == '1,2'
+
+
+def test_rows_are_written_after_the_thread_stops(tmp_path, monkeypatch):
+    def failing_loop(self):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(simmon._AutosaveThread, '_loop', failing_loop)
+    mon = simmon.Monitor('autosave', super_directory=str(tmp_path), enable_toggles=False, headless=True,
+                         autosave_thread=True, autosave_queue_size=1)
+    tracker = mon.tracker('x', 'y', autosave=True)
+    mon._autosave_thread._thread.join(5)
+
+    with pytest.raises(OSError):
+        tracker.update(0, 0)
+    for i in range(1, 5):
+        tracker.update(i, i)  # the queue is full, but nothing waits for the stopped thread
+
+    assert finalize_with_timeout(mon) is None
+    with open(tracker.path) as file:
+        assert file.read().splitlines()[-5:] == [f'{i},{i}' for i in range(5)]
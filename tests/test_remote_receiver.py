@@ -0,0 +1,35 @@
+"""Regression test: a connection with a wrong authentication key doesn't stop the
+receiver of tracker handles, and finalize() doesn't hang.
+
+Run from the repository root:
+    python -m pytest tests
+"""
+import sys
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'simmon'))
+
+import simmon  # noqa: E402
+
+
+def test_wrong_authkey_does_not_stop_the_receiver():
+    mon = simmon.QuietMonitor(enable_toggles=False, headless=True)
+    tracker = mon.tracker('x', 'y')
+    handle = tracker.handle()
+
+    with pytest.raises(AuthenticationError):
+        Client(mon._remote_receiver.address, authkey=b'wrong key')
+    time.sleep(0.1)
+
+    handle.update(1, 2)
+    handle.flush()
+
+    t0 = time.monotonic()
+    mon.finalize()
+    assert time.monotonic() - t0 < 5
+    assert len(tracker.data) == 1